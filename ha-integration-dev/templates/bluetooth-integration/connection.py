@@ -0,0 +1,200 @@
+"""Persistent GATT connection for Bluetooth Device.
+
+Generated with ha-integration@aurora-smart-home v1.0.0
+https://github.com/tonylofgren/aurora-smart-home
+
+This demonstrates:
+- Reusing one BLE connection across polls, closed after an idle timeout
+- Reading several characteristics in one session
+- Subscribing to notifications instead of polling where supported
+- Connect retries with exponential backoff
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterable
+import logging
+
+from bleak import BleakClient, BleakError
+from bleak.backends.device import BLEDevice
+
+from .const import (
+    CONNECT_ATTEMPTS,
+    CONNECT_BACKOFF,
+    CONNECT_TIMEOUT,
+    CONNECTION_IDLE_TIMEOUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class GattConnection:
+    """One connection to a device, kept open across polls.
+
+    BLE connects take seconds and cost the device battery, so the connection
+    is only closed after idle_timeout seconds without reads. Characteristics
+    that support notifications are subscribed to after their first read and
+    served from the last notified value; the connection then stays open for
+    as long as the device keeps it.
+    """
+
+    def __init__(
+        self,
+        ble_device_callback: Callable[[], BLEDevice | None],
+        on_notify: Callable[[str, bytearray], None] | None = None,
+        *,
+        idle_timeout: float = CONNECTION_IDLE_TIMEOUT,
+        client_class: type[BleakClient] = BleakClient,
+    ) -> None:
+        """Initialize the connection manager."""
+        self._ble_device_callback = ble_device_callback
+        self._on_notify = on_notify
+        self._idle_timeout = idle_timeout
+        # Replaceable for testing without hardware
+        self._client_class = client_class
+        self._client: BleakClient | None = None
+        self._connect_lock = asyncio.Lock()
+        self._idle_handle: asyncio.TimerHandle | None = None
+        self._disconnect_task: asyncio.Task[None] | None = None
+        # Latest value of each subscribed characteristic
+        self._notified: dict[str, bytearray] = {}
+
+        self.connects = 0
+        self.connect_failures = 0
+        self.reads = 0
+        self.notifications = 0
+
+    @property
+    def connected(self) -> bool:
+        """Return True if the device is connected."""
+        return self._client is not None and self._client.is_connected
+
+    async def async_read(self, uuids: Iterable[str]) -> dict[str, bytearray]:
+        """Return characteristic values, all read in one connection session.
+
+        Subscribed characteristics return their latest notified value.
+        Characteristics the device doesn't have or can't read are left out.
+        """
+        self._cancel_idle_disconnect()
+        client = await self._async_get_client()
+        values: dict[str, bytearray] = {}
+        try:
+            for uuid in uuids:
+                if uuid in self._notified:
+                    values[uuid] = self._notified[uuid]
+                    continue
+                try:
+                    values[uuid] = await client.read_gatt_char(uuid)
+                except BleakError as err:
+                    if not client.is_connected:
+                        raise
+                    _LOGGER.debug("Could not read %s: %s", uuid, err)
+                    continue
+                self.reads += 1
+                if self._on_notify and self._supports_notify(client, uuid):
+                    await self._async_subscribe(client, uuid, values[uuid])
+        finally:
+            self._schedule_idle_disconnect()
+        return values
+
+    async def async_disconnect(self) -> None:
+        """Close the connection."""
+        self._cancel_idle_disconnect()
+        client, self._client = self._client, None
+        self._notified.clear()
+        if client is not None and client.is_connected:
+            await client.disconnect()
+
+    async def _async_get_client(self) -> BleakClient:
+        """Return the connected client, connecting with retries if needed."""
+        async with self._connect_lock:
+            if self._client is not None and self._client.is_connected:
+                return self._client
+
+            delay = CONNECT_BACKOFF
+            for attempt in range(1, CONNECT_ATTEMPTS + 1):
+                if (ble_device := self._ble_device_callback()) is None:
+                    raise BleakError("Device not found")
+                client = self._client_class(
+                    ble_device,
+                    disconnected_callback=self._handle_disconnect,
+                    timeout=CONNECT_TIMEOUT,
+                )
+                try:
+                    await client.connect()
+                except (BleakError, asyncio.TimeoutError) as err:
+                    self.connect_failures += 1
+                    if attempt == CONNECT_ATTEMPTS:
+                        raise
+                    _LOGGER.debug(
+                        "Connect attempt %s to %s failed (%s), retrying in %.1f s",
+                        attempt,
+                        ble_device.address,
+                        err,
+                        delay,
+                    )
+                    await asyncio.sleep(delay)
+                    delay *= 2
+                    continue
+
+                self.connects += 1
+                self._client = client
+                return client
+
+        raise BleakError("No connect attempts configured")
+
+    @staticmethod
+    def _supports_notify(client: BleakClient, uuid: str) -> bool:
+        """Return True if the characteristic can notify."""
+        characteristic = client.services.get_characteristic(uuid)
+        return characteristic is not None and "notify" in characteristic.properties
+
+    async def _async_subscribe(
+        self, client: BleakClient, uuid: str, value: bytearray
+    ) -> None:
+        """Start notifications, falling back to polling if that fails."""
+
+        def _handle_notification(_characteristic, data: bytearray) -> None:
+            self._notified[uuid] = data
+            self.notifications += 1
+            self._on_notify(uuid, data)
+
+        try:
+            await client.start_notify(uuid, _handle_notification)
+        except BleakError as err:
+            _LOGGER.debug("Could not subscribe to %s, polling it: %s", uuid, err)
+            return
+        self._notified[uuid] = value
+
+    def _handle_disconnect(self, client: BleakClient) -> None:
+        """Forget a client the device disconnected."""
+        if client is self._client:
+            _LOGGER.debug("Disconnected from %s", client.address)
+            self._client = None
+            self._notified.clear()
+            self._cancel_idle_disconnect()
+
+    def _schedule_idle_disconnect(self) -> None:
+        """Close the connection after idle_timeout, unless notifications run."""
+        self._cancel_idle_disconnect()
+        if self._client is None or self._notified:
+            return
+        self._idle_handle = asyncio.get_running_loop().call_later(
+            self._idle_timeout, self._idle_disconnect
+        )
+
+    def _cancel_idle_disconnect(self) -> None:
+        """Cancel a scheduled idle disconnect."""
+        if self._idle_handle is not None:
+            self._idle_handle.cancel()
+            self._idle_handle = None
+
+    def _idle_disconnect(self) -> None:
+        """Disconnect after the idle timeout."""
+        self._idle_handle = None
+        # Detach first, so a read starting meanwhile connects again
+        client, self._client = self._client, None
+        if client is not None:
+            self._disconnect_task = asyncio.get_running_loop().create_task(
+                client.disconnect()
+            )
@@ -14,8 +14,21 @@ SERVICE_UUID = "0000180f-0000-1000-8000-00805f9b34fb"  # Battery Service UUID
 # Device identification
 DEVICE_NAME_PREFIX = "MyDevice"
 
+# Route advertisements of all configured devices through one Bluetooth
+# callback matching MANUFACTURER_ID (see dispatcher.py), instead of one
+# callback per device. Only for devices that advertise that manufacturer ID.
+SHARED_DISPATCHER = False
+DATA_DISPATCHER = f"{DOMAIN}_dispatcher"
+
 # Update intervals
 DEFAULT_SCAN_INTERVAL = 60  # seconds
+RSSI_UPDATE_INTERVAL = 60  # seconds between updates when only RSSI changed
+
+# Active connections, kept open across polls (idle timeout > scan interval)
+CONNECTION_IDLE_TIMEOUT = 150  # seconds without reads before disconnecting
+CONNECT_TIMEOUT = 20  # seconds per connect attempt
+CONNECT_ATTEMPTS = 3
+CONNECT_BACKOFF = 1  # seconds before the first retry, doubled per retry
 
 # Characteristic UUIDs (examples)
 CHAR_BATTERY_LEVEL = "00002a19-0000-1000-8000-00805f9b34fb"
@@ -5,7 +5,7 @@ https://github.com/tonylofgren/aurora-smart-home
 
 This demonstrates:
 - Passive Bluetooth data collection (advertisements)
-- Active Bluetooth connections for reading characteristics
+- Active Bluetooth connections for reading characteristics, reused across polls
 - Proper async handling for Bluetooth operations
 """
 from __future__ import annotations
@@ -15,7 +15,7 @@ import logging
 from datetime import timedelta
 from typing import TYPE_CHECKING
 
-from bleak import BleakClient, BleakError
+from bleak import BleakError
 from bleak.backends.device import BLEDevice
 
 from homeassistant.components.bluetooth import (
@@ -30,12 +30,15 @@ from homeassistant.helpers.update_coordinator import (
     UpdateFailed,
 )
 
+from .connection import GattConnection
 from .const import (
-    CHAR_BATTERY_LEVEL,
-    CHAR_TEMPERATURE,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    RSSI_UPDATE_INTERVAL,
+    SHARED_DISPATCHER,
 )
+from .dispatcher import async_get_dispatcher
+from .parser import ADVERTISEMENT_PARSERS, CHARACTERISTIC_PARSERS
 
 if TYPE_CHECKING:
     from . import MyConfigEntry
@@ -67,41 +70,75 @@ class MyBluetoothCoordinator(DataUpdateCoordinator[dict]):
 
         # Cached data from advertisements
         self._advertisement_data: dict = {}
+        # Raw payloads the cached data was parsed from
+        self._last_payloads: list[bytes | None] = [None] * len(ADVERTISEMENT_PARSERS)
+        self._last_rssi_update = 0.0
+
+        # Active connection, kept open between polls
+        self._gatt = GattConnection(
+            self._ble_device_from_address, self._async_handle_notification
+        )
 
     def async_start(self) -> callable:
         """Start listening for Bluetooth advertisements."""
-        @callback
-        def _async_bluetooth_callback(
-            service_info: BluetoothServiceInfoBleak,
-            change: BluetoothChange,
-        ) -> None:
-            """Handle Bluetooth advertisement."""
-            _LOGGER.debug(
-                "Received advertisement from %s: RSSI=%s",
-                service_info.address,
-                service_info.rssi,
-            )
-
-            # Parse advertisement data
-            self._advertisement_data = self._parse_advertisement(service_info)
-
-            # Update coordinator data
-            self.async_set_updated_data({
-                **self.data or {},
-                **self._advertisement_data,
-                "rssi": service_info.rssi,
-            })
+        if SHARED_DISPATCHER:
+            # One callback for all devices of the integration, routed here
+            # by address
+            self._cancel_bluetooth_callback = async_get_dispatcher(
+                self.hass
+            ).async_register(self.address, self._async_handle_advertisement)
+            return self._cancel_bluetooth_callback
 
         # Register for advertisements from this device
         self._cancel_bluetooth_callback = async_register_callback(
             self.hass,
-            _async_bluetooth_callback,
+            self._async_handle_advertisement,
             BluetoothCallbackMatcher(address=self.address),
             BluetoothScanningMode.PASSIVE,
         )
 
         return self._cancel_bluetooth_callback
 
+    @callback
+    def _async_handle_advertisement(
+        self,
+        service_info: BluetoothServiceInfoBleak,
+        change: BluetoothChange,
+    ) -> None:
+        """Handle Bluetooth advertisement."""
+        _LOGGER.debug(
+            "Received advertisement from %s: RSSI=%s",
+            service_info.address,
+            service_info.rssi,
+        )
+
+        # Devices repeat the same advertisement several times a second,
+        # so only parse when the raw payload bytes changed
+        changes = ADVERTISEMENT_PARSERS.parse_changed(
+            service_info.manufacturer_data,
+            service_info.service_data,
+            self._last_payloads,
+        )
+        parsed_changed = False
+        if changes is not None:
+            self._log_payloads()
+            parsed = {**self._advertisement_data, **changes}
+            parsed_changed = parsed != self._advertisement_data
+            self._advertisement_data = parsed
+
+        data = self.data or {}
+        if not parsed_changed and (
+            service_info.rssi == data.get("rssi")
+            or service_info.time - self._last_rssi_update < RSSI_UPDATE_INTERVAL
+        ):
+            # Nothing new, or an RSSI-only change within the interval
+            return
+
+        self._last_rssi_update = service_info.time
+        self.async_set_updated_data(
+            {**data, **self._advertisement_data, "rssi": service_info.rssi}
+        )
+
     async def _async_update_data(self) -> dict:
         """Fetch data from the Bluetooth device.
 
@@ -113,6 +150,7 @@ class MyBluetoothCoordinator(DataUpdateCoordinator[dict]):
             # Option 1: Just return advertisement data (passive)
             if self._advertisement_data:
                 return {
+                    **(self.data or {}),
                     **self._advertisement_data,
                     "last_seen": self.hass.loop.time(),
                 }
@@ -129,61 +167,51 @@ class MyBluetoothCoordinator(DataUpdateCoordinator[dict]):
         """Read data from device via active BLE connection.
 
         Use this pattern when you need to read characteristics
-        that aren't available in advertisements.
+        that aren't available in advertisements. All characteristics are
+        read in one session of a connection kept open between polls.
         """
-        data: dict = {}
+        values = await self._gatt.async_read(CHARACTERISTIC_PARSERS)
+        return self._parse_characteristics(values)
 
-        # Get fresh BLE device reference
-        ble_device = async_ble_device_from_address(
+    def _ble_device_from_address(self) -> BLEDevice | None:
+        """Return a fresh BLE device reference for connecting."""
+        return async_ble_device_from_address(
             self.hass, self.address, connectable=True
         )
 
-        if not ble_device:
-            raise UpdateFailed("Device not found")
-
-        async with BleakClient(ble_device) as client:
-            # Read battery level
-            try:
-                battery_data = await client.read_gatt_char(CHAR_BATTERY_LEVEL)
-                data["battery"] = battery_data[0]
-            except BleakError:
-                _LOGGER.debug("Could not read battery level")
-
-            # Read temperature (if available)
-            try:
-                temp_data = await client.read_gatt_char(CHAR_TEMPERATURE)
-                # Parse temperature (format depends on device)
-                data["temperature"] = int.from_bytes(temp_data[:2], "little") / 100
-            except BleakError:
-                _LOGGER.debug("Could not read temperature")
-
-        return data
+    @callback
+    def _async_handle_notification(self, uuid: str, value: bytearray) -> None:
+        """Update data from a characteristic notification."""
+        parsed = self._parse_characteristics({uuid: value})
+        data = self.data or {}
+        if all(data.get(key) == item for key, item in parsed.items()):
+            return
+        self.async_set_updated_data({**data, **parsed})
 
-    def _parse_advertisement(
-        self, service_info: BluetoothServiceInfoBleak
-    ) -> dict:
-        """Parse manufacturer data from advertisement.
+    def _parse_characteristics(self, values: dict[str, bytearray]) -> dict:
+        """Parse characteristic values.
 
-        Customize this based on your device's advertisement format.
+        Value layouts are declared in parser.py.
         """
         data: dict = {}
+        for uuid, value in values.items():
+            data |= CHARACTERISTIC_PARSERS[uuid].parse(value)
+        return data
 
-        # Example: Parse manufacturer data
-        # Format varies by device - check your device's documentation
-        if manufacturer_data := service_info.manufacturer_data:
-            for manufacturer_id, payload in manufacturer_data.items():
-                _LOGGER.debug(
-                    "Manufacturer %04x data: %s",
-                    manufacturer_id,
-                    payload.hex(),
-                )
-
-                # Example parsing (customize for your device):
-                # if len(payload) >= 4:
-                #     data["battery"] = payload[0]
-                #     data["temperature"] = int.from_bytes(payload[1:3], "little") / 10
+    async def async_shutdown(self) -> None:
+        """Close the connection when the entry is unloaded."""
+        await super().async_shutdown()
+        await self._gatt.async_disconnect()
 
-        return data
+    def _log_payloads(self) -> None:
+        """Log the raw advertisement payloads (debug logging only)."""
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            # Only hex-encode when the output is actually logged
+            _LOGGER.debug(
+                "Advertisement payloads from %s: %s",
+                self.address,
+                [payload.hex() for payload in self._last_payloads if payload],
+            )
 
 
 # Import needed for async_ble_device_from_address
@@ -0,0 +1,83 @@
+"""Shared advertisement dispatcher for Bluetooth Device.
+
+Generated with ha-integration@aurora-smart-home v1.0.0
+https://github.com/tonylofgren/aurora-smart-home
+
+This demonstrates:
+- One Bluetooth callback for all configured devices of the integration
+- Routing advertisements to devices by address through a dict
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from homeassistant.components.bluetooth import (
+    BluetoothCallbackMatcher,
+    BluetoothChange,
+    BluetoothScanningMode,
+    BluetoothServiceInfoBleak,
+    async_register_callback,
+)
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import DATA_DISPATCHER, MANUFACTURER_ID
+
+AdvertisementCallback = Callable[[BluetoothServiceInfoBleak, BluetoothChange], None]
+
+
+@callback
+def async_get_dispatcher(hass: HomeAssistant) -> AdvertisementDispatcher:
+    """Return the dispatcher shared by all config entries."""
+    if (dispatcher := hass.data.get(DATA_DISPATCHER)) is None:
+        dispatcher = hass.data[DATA_DISPATCHER] = AdvertisementDispatcher(hass)
+    return dispatcher
+
+
+class AdvertisementDispatcher:
+    """Receive advertisements once and route them by device address.
+
+    With one address matcher per device, every config entry registers its
+    own Bluetooth callback. Here the integration registers a single one,
+    matching the manufacturer ID, while there are devices to route to.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the dispatcher."""
+        self.hass = hass
+        self._callbacks: dict[str, AdvertisementCallback] = {}
+        self._cancel: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_register(
+        self, address: str, advertisement_callback: AdvertisementCallback
+    ) -> CALLBACK_TYPE:
+        """Route advertisements from address to a callback."""
+        address = address.upper()
+        self._callbacks[address] = advertisement_callback
+        if self._cancel is None:
+            self._cancel = async_register_callback(
+                self.hass,
+                self._async_dispatch,
+                # Match on SERVICE_UUID instead for devices that advertise
+                # service data: BluetoothCallbackMatcher(service_uuid=...)
+                BluetoothCallbackMatcher(manufacturer_id=MANUFACTURER_ID),
+                BluetoothScanningMode.PASSIVE,
+            )
+
+        @callback
+        def unregister() -> None:
+            if self._callbacks.get(address) is advertisement_callback:
+                del self._callbacks[address]
+            if not self._callbacks and self._cancel is not None:
+                self._cancel()
+                self._cancel = None
+
+        return unregister
+
+    @callback
+    def _async_dispatch(
+        self, service_info: BluetoothServiceInfoBleak, change: BluetoothChange
+    ) -> None:
+        """Pass an advertisement to the device it came from, if configured."""
+        if advertisement_callback := self._callbacks.get(service_info.address):
+            advertisement_callback(service_info, change)
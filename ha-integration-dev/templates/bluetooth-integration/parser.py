@@ -0,0 +1,148 @@
+"""Advertisement parsers for Bluetooth Device.
+
+Generated with ha-integration@aurora-smart-home v1.0.0
+https://github.com/tonylofgren/aurora-smart-home
+
+This demonstrates:
+- Declarative payload layouts with precompiled struct formats
+- Divisor and offset rules per value
+- A registry keyed by manufacturer ID and service UUID
+- The same layouts for GATT characteristic values
+"""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+import struct
+from typing import Any
+
+from .const import (
+    CHAR_BATTERY_LEVEL,
+    CHAR_TEMPERATURE,
+    MANUFACTURER_ID,
+    SERVICE_UUID,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Field:
+    """One unpacked value: key in the coordinator data, value / divisor + offset.
+
+    Dividing (by 10 for 0.1 units) gives -0.7 where multiplying by 0.1 gives
+    -0.7000000000000001.
+    """
+
+    key: str
+    divisor: float = 1
+    offset: float = 0
+
+
+class PayloadLayout:
+    """Precompiled struct layout of one advertisement payload.
+
+    Pad bytes ("x") in the format produce no value; every other item maps to
+    a Field, in order.
+    """
+
+    def __init__(self, fmt: str, *fields: Field, start: int = 0) -> None:
+        """Compile the layout."""
+        compiled = struct.Struct(fmt)
+        if len(compiled.unpack(bytes(compiled.size))) != len(fields):
+            raise ValueError(f"Format {fmt!r} doesn't match {len(fields)} fields")
+        self._unpack_from = compiled.unpack_from
+        self._start = start
+        # (key, index, divisor, offset); divisor None: used as unpacked
+        self._rules = tuple(
+            (field.key, index, field.divisor, field.offset)
+            if field.divisor != 1 or field.offset != 0
+            else (field.key, index, None, 0)
+            for index, field in enumerate(fields)
+        )
+
+    def parse(self, payload: bytes) -> dict[str, Any]:
+        """Decode a payload, or return {} if it's too short."""
+        try:
+            # Reads the buffer in place, no slice is copied
+            values = self._unpack_from(payload, self._start)
+        except struct.error:
+            return {}
+        # One pass straight into the result; indexing beats a zip object here
+        data: dict[str, Any] = {}
+        for key, index, divisor, offset in self._rules:
+            if divisor is None:
+                data[key] = values[index]
+            else:
+                data[key] = values[index] / divisor + offset
+        return data
+
+
+class ParserRegistry:
+    """Payload layouts by manufacturer ID and service data UUID."""
+
+    def __init__(
+        self,
+        manufacturer: Mapping[int, PayloadLayout] | None = None,
+        service: Mapping[str, PayloadLayout] | None = None,
+    ) -> None:
+        """Initialize the registry."""
+        sources = [
+            *((False, key, layout) for key, layout in (manufacturer or {}).items()),
+            *((True, key, layout) for key, layout in (service or {}).items()),
+        ]
+        # Flat (index, from_service, key, parse) entries, walked on every
+        # advertisement
+        self._sources = tuple(
+            (index, from_service, key, layout.parse)
+            for index, (from_service, key, layout) in enumerate(sources)
+        )
+
+    def __len__(self) -> int:
+        """Return the number of registered sources."""
+        return len(self._sources)
+
+    def parse_changed(
+        self,
+        manufacturer_data: Mapping[int, bytes],
+        service_data: Mapping[str, bytes],
+        payloads: list[bytes | None],
+    ) -> dict[str, Any] | None:
+        """Decode the payloads that differ from payloads, updating it.
+
+        payloads holds the last raw payload of every source, by position.
+        Returns None when nothing changed: a repeated advertisement costs a
+        lookup and a bytes comparison per source and allocates nothing.
+        """
+        data: dict[str, Any] | None = None
+        for index, from_service, key, parse in self._sources:
+            payload = (service_data if from_service else manufacturer_data).get(key)
+            if payload == payloads[index]:
+                continue
+            payloads[index] = payload
+            parsed = {} if payload is None else parse(payload)
+            data = parsed if data is None else data | parsed
+        return data
+
+
+# Customize for your device's advertisement format
+ADVERTISEMENT_PARSERS = ParserRegistry(
+    manufacturer={
+        # uint8 battery %, int16 temperature in 0.1 °C, little endian
+        MANUFACTURER_ID: PayloadLayout(
+            "<Bh",
+            Field("battery"),
+            Field("temperature", divisor=10),
+        ),
+    },
+    service={
+        # Battery Service data: uint8 battery %
+        SERVICE_UUID: PayloadLayout("<B", Field("battery")),
+    },
+)
+
+# Characteristics read over an active connection, by UUID
+CHARACTERISTIC_PARSERS: dict[str, PayloadLayout] = {
+    # Battery Level: uint8 %
+    CHAR_BATTERY_LEVEL: PayloadLayout("<B", Field("battery")),
+    # Temperature: sint16 in 0.01 °C
+    CHAR_TEMPERATURE: PayloadLayout("<h", Field("temperature", divisor=100)),
+}
@@ -9,16 +9,21 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_API_KEY, CONF_HOST
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import MyHubApiError, MyHubClient
 from .coordinator import MyHubCoordinator
-from .const import DOMAIN, PLATFORMS
+from .const import CONF_PUSH, DEFAULT_PUSH, DOMAIN, PLATFORMS
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up My Smart Hub from config entry."""
-    # Create API client
-    client = MyHubClient(entry.data[CONF_HOST], entry.data[CONF_API_KEY])
+    # Create API client on Home Assistant's shared HTTP session
+    client = MyHubClient(
+        async_get_clientsession(hass),
+        entry.data[CONF_HOST],
+        entry.data[CONF_API_KEY],
+    )
 
     # Create coordinator
     coordinator = MyHubCoordinator(hass, client, entry)
@@ -43,6 +48,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Setup platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Follow the hub's event stream; polling continues as a slow safety net
+    if entry.options.get(CONF_PUSH, DEFAULT_PUSH):
+        coordinator.async_start_push()
+
+    # Fail switch commands still queued when the entry unloads
+    entry.async_on_unload(client.close)
+
     # Register update listener for options
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
@@ -51,15 +63,30 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload config entry."""
-    # Unload platforms
+    # Unload platforms (the shared HTTP session is owned by Home Assistant)
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        # Close client
-        coordinator: MyHubCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
-        await coordinator.client.async_close()
+        hass.data[DOMAIN].pop(entry.entry_id)
 
     return unload_ok
 
 
+async def async_remove_config_entry_device(
+    hass: HomeAssistant, entry: ConfigEntry, device_entry: dr.DeviceEntry
+) -> bool:
+    """Allow removing a child device the hub no longer reports."""
+    coordinator: MyHubCoordinator = hass.data[DOMAIN][entry.entry_id]
+    if any(
+        identifier[0] == DOMAIN
+        and (identifier[1] == entry.entry_id or identifier[1] in coordinator.data)
+        for identifier in device_entry.identifiers
+    ):
+        return False
+    for identifier in device_entry.identifiers:
+        if identifier[0] == DOMAIN:
+            coordinator.async_forget_device(identifier[1])
+    return True
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry when options change."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -1,23 +1,150 @@
 """API client for My Smart Hub."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable
 from dataclasses import dataclass
+import sys
 from typing import Any
 
 import aiohttp
 
+# Explicit timeouts so a hung hub can't stall a coordinator refresh
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=15, connect=5)
 
-@dataclass
+# Switch commands issued within this window are sent as one batch request
+COMMAND_BATCH_WINDOW = 0.05
+
+# Ping interval on the event stream; a hub missing the pong is disconnected
+EVENT_STREAM_HEARTBEAT = 30
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class DeviceSchema:
+    """Sensor and switch keys shared by all devices reporting the same keys.
+
+    Schemas are shared singletons, so they compare and hash by identity.
+    """
+
+    sensor_keys: tuple[str, ...]
+    switch_keys: tuple[str, ...]
+    sensor_index: dict[str, int]
+    switch_index: dict[str, int]
+
+
+# One schema per distinct key layout (in practice: per device model)
+_SCHEMAS: dict[tuple[tuple[str, ...], tuple[str, ...]], DeviceSchema] = {}
+
+
+def _get_schema(
+    sensor_keys: tuple[str, ...], switch_keys: tuple[str, ...]
+) -> DeviceSchema:
+    """Return the shared schema for a key layout, creating it once."""
+    if (schema := _SCHEMAS.get((sensor_keys, switch_keys))) is None:
+        sensors = tuple(sys.intern(key) for key in sensor_keys)
+        switches = tuple(sys.intern(key) for key in switch_keys)
+        schema = _SCHEMAS[(sensors, switches)] = DeviceSchema(
+            sensor_keys=sensors,
+            switch_keys=switches,
+            sensor_index={key: i for i, key in enumerate(sensors)},
+            switch_index={key: i for i, key in enumerate(switches)},
+        )
+    return schema
+
+
+@dataclass(slots=True)
 class HubDevice:
-    """Representation of a hub device."""
+    """Representation of a hub device.
+
+    Sensor and switch values are stored as tuples indexed through a shared
+    DeviceSchema instead of two dicts per device, which keeps memory and GC
+    pressure low on hubs with thousands of devices.
+    """
 
     id: str
     name: str
     model: str
     firmware: str
     online: bool
-    sensors: dict[str, Any]
-    switches: dict[str, bool]
+    schema: DeviceSchema
+    sensor_values: tuple[Any, ...]
+    switch_values: tuple[bool, ...]
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> HubDevice:
+        """Create a device from an API payload."""
+        sensors: dict[str, Any] = data.get("sensors", {})
+        switches: dict[str, bool] = data.get("switches", {})
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            model=sys.intern(data["model"]),
+            firmware=sys.intern(data["firmware"]),
+            online=data["online"],
+            schema=_get_schema(tuple(sensors), tuple(switches)),
+            sensor_values=tuple(sensors.values()),
+            switch_values=tuple(switches.values()),
+        )
+
+    def matches(self, data: dict[str, Any]) -> bool:
+        """Return True if an API payload holds the same state as this device."""
+        sensors: dict[str, Any] = data.get("sensors", {})
+        switches: dict[str, bool] = data.get("switches", {})
+        return (
+            self.online == data["online"]
+            and self.sensor_values == tuple(sensors.values())
+            and self.switch_values == tuple(switches.values())
+            and self.schema.sensor_keys == tuple(sensors)
+            and self.schema.switch_keys == tuple(switches)
+            and self.name == data["name"]
+            and self.firmware == data["firmware"]
+            and self.model == data["model"]
+        )
+
+    def apply_delta(self, delta: dict[str, Any]) -> HubDevice:
+        """Return the device with a partial payload applied (self if unchanged).
+
+        A delta holds any subset of the payload fields; sensors and switches
+        are merged key by key.
+        """
+        payload = {
+            "id": self.id,
+            "name": delta.get("name", self.name),
+            "model": delta.get("model", self.model),
+            "firmware": delta.get("firmware", self.firmware),
+            "online": delta.get("online", self.online),
+            "sensors": {**self.sensors, **(delta.get("sensors") or {})},
+            "switches": {**self.switches, **(delta.get("switches") or {})},
+        }
+        return self if self.matches(payload) else HubDevice.from_dict(payload)
+
+    def has_sensor(self, key: str) -> bool:
+        """Return True if the device reports a sensor."""
+        return key in self.schema.sensor_index
+
+    def sensor(self, key: str, default: Any = None) -> Any:
+        """Return a sensor value."""
+        index = self.schema.sensor_index.get(key)
+        return default if index is None else self.sensor_values[index]
+
+    def has_switch(self, key: str) -> bool:
+        """Return True if the device has a switch."""
+        return key in self.schema.switch_index
+
+    def switch(self, key: str) -> bool:
+        """Return a switch state (False if the switch doesn't exist)."""
+        index = self.schema.switch_index.get(key)
+        return False if index is None else self.switch_values[index]
+
+    @property
+    def sensors(self) -> dict[str, Any]:
+        """Return all sensor values as a new dict."""
+        return dict(zip(self.schema.sensor_keys, self.sensor_values))
+
+    @property
+    def switches(self) -> dict[str, bool]:
+        """Return all switch states as a new dict."""
+        return dict(zip(self.schema.switch_keys, self.switch_values))
 
 
 class MyHubApiError(Exception):
@@ -32,14 +159,37 @@ class MyHubConnectionError(MyHubApiError):
     """Connection error."""
 
 
+class MyHubNotFoundError(MyHubApiError):
+    """Endpoint or resource not found."""
+
+
 class MyHubClient:
-    """API client for My Smart Hub."""
+    """API client for My Smart Hub.
+
+    Uses a session passed in by the caller - normally Home Assistant's shared
+    session from async_get_clientsession(), whose pooled keep-alive connector
+    (per-host limits, DNS cache) is reused across polls and across hubs.
+    """
 
-    def __init__(self, host: str, api_key: str) -> None:
+    def __init__(
+        self, session: aiohttp.ClientSession, host: str, api_key: str
+    ) -> None:
         """Initialize the client."""
         self.host = host
         self.api_key = api_key
-        self._session: aiohttp.ClientSession | None = None
+        self._session = session
+        self._base_url = f"http://{host}"
+        self._headers = {"Authorization": f"Bearer {api_key}"}
+        self._etags: dict[str, str] = {}
+        self._response_sizes: dict[str, int] = {}
+
+        # Switch command queue: (device_id, switch_id) -> state, last one wins
+        self._pending_commands: dict[tuple[str, str], bool] = {}
+        self._pending_waiters: list[asyncio.Future[None]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # Batches in flight; strong references until they finish
+        self._flush_tasks: set[asyncio.Task[None]] = set()
+        self._batch_supported = True
 
     async def async_get_hub_info(self) -> dict[str, Any]:
         """Get hub information."""
@@ -48,62 +198,224 @@ class MyHubClient:
     async def async_get_devices(self) -> list[HubDevice]:
         """Get all devices connected to hub."""
         data = await self._request("GET", "/api/devices")
-        return [
-            HubDevice(
-                id=d["id"],
-                name=d["name"],
-                model=d["model"],
-                firmware=d["firmware"],
-                online=d["online"],
-                sensors=d.get("sensors", {}),
-                switches=d.get("switches", {}),
-            )
-            for d in data.get("devices", [])
-        ]
+        return [HubDevice.from_dict(d) for d in data.get("devices", [])]
+
+    async def async_get_devices_if_modified(self) -> list[dict[str, Any]] | None:
+        """Get raw device payloads, or None if nothing changed since last call.
+
+        Sends the previous ETag as If-None-Match; an unchanged hub answers
+        304 Not Modified without a body.
+        """
+        data = await self._request("GET", "/api/devices", conditional=True)
+        if data is None:
+            return None
+        return data.get("devices", [])
+
+    async def async_get_device(self, device_id: str) -> dict[str, Any]:
+        """Get the raw payload of a single device."""
+        return await self._request("GET", f"/api/devices/{device_id}")
+
+    async def async_listen_events(
+        self,
+        on_event: Callable[[dict[str, Any]], None],
+        on_connected: Callable[[], None] | None = None,
+    ) -> None:
+        """Stream hub events to on_event until the stream drops.
+
+        Events are {"type": "device", "id": ..., <changed fields>} deltas, or
+        "device_added"/"device_removed". Always ends with an exception:
+        MyHubNotFoundError if the hub has no event stream, otherwise
+        MyHubConnectionError once the connection is lost.
+        """
+        try:
+            async with self._session.ws_connect(
+                self._base_url + "/api/events",
+                headers=self._headers,
+                heartbeat=EVENT_STREAM_HEARTBEAT,
+            ) as ws:
+                if on_connected is not None:
+                    on_connected()
+                async for msg in ws:
+                    if msg.type is not aiohttp.WSMsgType.TEXT:
+                        break
+                    try:
+                        event = msg.json()
+                    except ValueError:
+                        continue  # Skip frames that aren't JSON
+                    if isinstance(event, dict):
+                        on_event(event)
+        except aiohttp.WSServerHandshakeError as err:
+            if err.status == 401:
+                raise MyHubAuthError("Invalid API key") from err
+            if err.status == 404:
+                raise MyHubNotFoundError("Hub has no event stream") from err
+            raise MyHubConnectionError(f"Event stream error: {err}") from err
+        except (aiohttp.ClientError, TimeoutError, ValueError) as err:
+            raise MyHubConnectionError(f"Event stream error: {err}") from err
+        raise MyHubConnectionError("Event stream closed")
+
+    def response_size(self, path: str) -> int | None:
+        """Return the body size in bytes of the last response for a path."""
+        return self._response_sizes.get(path)
 
     async def async_turn_on(self, device_id: str, switch_id: str) -> None:
         """Turn on a switch."""
-        await self._request(
-            "POST",
-            f"/api/devices/{device_id}/switches/{switch_id}",
-            json={"state": True},
-        )
+        await self.async_set_switch(device_id, switch_id, True)
 
     async def async_turn_off(self, device_id: str, switch_id: str) -> None:
         """Turn off a switch."""
-        await self._request(
-            "POST",
-            f"/api/devices/{device_id}/switches/{switch_id}",
-            json={"state": False},
+        await self.async_set_switch(device_id, switch_id, False)
+
+    async def async_set_switch(
+        self, device_id: str, switch_id: str, state: bool
+    ) -> None:
+        """Queue a switch command and wait until its batch has been sent.
+
+        Commands issued within COMMAND_BATCH_WINDOW (e.g. a scene switching
+        40 outlets) are coalesced into a single POST /api/switches.
+        """
+        loop = asyncio.get_running_loop()
+        waiter: asyncio.Future[None] = loop.create_future()
+        self._pending_commands[(device_id, switch_id)] = state
+        self._pending_waiters.append(waiter)
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(
+                COMMAND_BATCH_WINDOW, self._start_flush
+            )
+        await waiter
+
+    def _start_flush(self) -> None:
+        """Send the queued commands as one batch."""
+        commands, self._pending_commands = self._pending_commands, {}
+        waiters, self._pending_waiters = self._pending_waiters, []
+        self._flush_handle = None
+        task = asyncio.create_task(self._async_flush(commands, waiters))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _async_flush(
+        self,
+        commands: dict[tuple[str, str], bool],
+        waiters: list[asyncio.Future[None]],
+    ) -> None:
+        """Send a batch of commands and resolve everyone waiting on it.
+
+        Every waiter gets a result or a MyHubApiError, whatever happens.
+        """
+        error: MyHubApiError | None = None
+        try:
+            await self._async_send_commands(commands)
+        except MyHubApiError as err:
+            error = err
+        except asyncio.CancelledError:
+            error = MyHubConnectionError("Switch commands cancelled")
+            raise
+        except Exception as err:  # noqa: BLE001 - waiters must not hang
+            error = MyHubApiError(f"Unexpected error sending commands: {err!r}")
+        finally:
+            _resolve_waiters(waiters, error)
+
+    def close(self) -> None:
+        """Cancel queued and in-flight switch commands, e.g. on unload."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending_commands = {}
+        waiters, self._pending_waiters = self._pending_waiters, []
+        _resolve_waiters(waiters, MyHubConnectionError("Client closed"))
+        for task in self._flush_tasks:
+            task.cancel()
+
+    async def _async_send_commands(
+        self, commands: dict[tuple[str, str], bool]
+    ) -> None:
+        """Send commands as one batch, or one request each if unsupported."""
+        if self._batch_supported and len(commands) > 1:
+            try:
+                await self._request(
+                    "POST",
+                    "/api/switches",
+                    json={
+                        "commands": [
+                            {
+                                "device_id": device_id,
+                                "switch_id": switch_id,
+                                "state": state,
+                            }
+                            for (device_id, switch_id), state in commands.items()
+                        ]
+                    },
+                )
+            except MyHubNotFoundError:
+                # Hub firmware without the batch endpoint
+                self._batch_supported = False
+            else:
+                return
+
+        await asyncio.gather(
+            *(
+                self._request(
+                    "POST",
+                    f"/api/devices/{device_id}/switches/{switch_id}",
+                    json={"state": state},
+                )
+                for (device_id, switch_id), state in commands.items()
+            )
         )
 
     async def _request(
         self,
         method: str,
         path: str,
+        conditional: bool = False,
         **kwargs: Any,
-    ) -> dict[str, Any]:
-        """Make API request."""
-        if self._session is None:
-            self._session = aiohttp.ClientSession()
+    ) -> dict[str, Any] | None:
+        """Make API request.
 
-        headers = {"Authorization": f"Bearer {self.api_key}"}
-        url = f"http://{self.host}{path}"
+        With conditional=True the ETag of the last response for this path is
+        sent as If-None-Match, and None is returned on 304 Not Modified.
+        """
+        headers = self._headers
+        if conditional and (etag := self._etags.get(path)):
+            headers = {**headers, "If-None-Match": etag}
 
         try:
             async with self._session.request(
-                method, url, headers=headers, **kwargs
+                method,
+                self._base_url + path,
+                headers=headers,
+                timeout=REQUEST_TIMEOUT,
+                **kwargs,
             ) as resp:
+                if resp.status == 304:
+                    return None
                 if resp.status == 401:
                     raise MyHubAuthError("Invalid API key")
+                if resp.status == 404:
+                    raise MyHubNotFoundError(f"Not found: {path}")
                 if resp.status >= 400:
                     raise MyHubApiError(f"API error: {resp.status}")
-                return await resp.json()
-        except aiohttp.ClientError as err:
+                if resp.content_length is not None:
+                    self._response_sizes[path] = resp.content_length
+                try:
+                    data = await resp.json()
+                except ValueError as err:
+                    raise MyHubApiError(f"Invalid response: {err}") from err
+                if conditional and (etag := resp.headers.get("ETag")):
+                    self._etags[path] = etag
+                return data
+        except (aiohttp.ClientError, TimeoutError) as err:
             raise MyHubConnectionError(f"Connection error: {err}") from err
 
-    async def async_close(self) -> None:
-        """Close the session."""
-        if self._session:
-            await self._session.close()
-            self._session = None
+
+def _resolve_waiters(
+    waiters: list[asyncio.Future[None]], error: MyHubApiError | None
+) -> None:
+    """Resolve command waiters that are still pending."""
+    for waiter in waiters:
+        if waiter.done():
+            continue
+        if error is None:
+            waiter.set_result(None)
+        else:
+            waiter.set_exception(error)
@@ -1,8 +1,9 @@
 """Binary sensor platform for My Smart Hub."""
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
+from typing import Any
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -10,13 +11,13 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .api import HubDevice
 from .coordinator import MyHubCoordinator
 from .const import DOMAIN
-from .entity import MyHubEntity
+from .entity import DescriptionIndex, MyHubEntity
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -24,6 +25,7 @@ class MyHubBinarySensorEntityDescription(BinarySensorEntityDescription):
     """Describes My Hub binary sensor entity."""
 
     value_fn: Callable[[HubDevice], bool]
+    # Evaluated once per device model, see DescriptionIndex
     exists_fn: Callable[[HubDevice], bool] = lambda _: True
 
 
@@ -32,15 +34,15 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[MyHubBinarySensorEntityDescription, ...] = (
         key="motion",
         translation_key="motion",
         device_class=BinarySensorDeviceClass.MOTION,
-        value_fn=lambda device: device.sensors.get("motion", False),
-        exists_fn=lambda device: "motion" in device.sensors,
+        value_fn=lambda device: device.sensor("motion", False),
+        exists_fn=lambda device: device.has_sensor("motion"),
     ),
     MyHubBinarySensorEntityDescription(
         key="door",
         translation_key="door",
         device_class=BinarySensorDeviceClass.DOOR,
-        value_fn=lambda device: device.sensors.get("door", False),
-        exists_fn=lambda device: "door" in device.sensors,
+        value_fn=lambda device: device.sensor("door", False),
+        exists_fn=lambda device: device.has_sensor("door"),
     ),
     MyHubBinarySensorEntityDescription(
         key="online",
@@ -50,6 +52,8 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[MyHubBinarySensorEntityDescription, ...] = (
     ),
 )
 
+BINARY_SENSOR_INDEX = DescriptionIndex(BINARY_SENSOR_DESCRIPTIONS)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -59,15 +63,23 @@ async def async_setup_entry(
     """Set up binary sensor platform."""
     coordinator: MyHubCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[MyHubBinarySensor] = []
-    for device_id, device in coordinator.data.items():
-        for description in BINARY_SENSOR_DESCRIPTIONS:
-            if description.exists_fn(device):
-                entities.append(
-                    MyHubBinarySensor(coordinator, device_id, description)
-                )
+    def _create_entities(device_ids: Iterable[str]) -> list[MyHubBinarySensor]:
+        """Create entities for the given devices."""
+        entities: list[MyHubBinarySensor] = []
+        for device_id in device_ids:
+            device = coordinator.data[device_id]
+            for description in BINARY_SENSOR_INDEX.for_device(device):
+                entities.append(MyHubBinarySensor(coordinator, device_id, description))
+        return entities
+
+    @callback
+    def _async_add_new_devices() -> None:
+        """Add entities for devices that appeared since the last refresh."""
+        if coordinator.new_device_ids:
+            async_add_entities(_create_entities(coordinator.new_device_ids))
 
-    async_add_entities(entities)
+    async_add_entities(_create_entities(coordinator.data))
+    entry.async_on_unload(coordinator.async_add_listener(_async_add_new_devices))
 
 
 class MyHubBinarySensor(MyHubEntity, BinarySensorEntity):
@@ -90,3 +102,7 @@ class MyHubBinarySensor(MyHubEntity, BinarySensorEntity):
     def is_on(self) -> bool:
         """Return binary sensor state."""
         return self.entity_description.value_fn(self.device)
+
+    def _state_value(self) -> Any:
+        """Return the value compared for change detection."""
+        return self.is_on
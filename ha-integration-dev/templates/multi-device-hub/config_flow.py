@@ -13,7 +13,9 @@ from homeassistant.config_entries import (
 )
 from homeassistant.const import CONF_API_KEY, CONF_HOST
 from homeassistant.core import callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.selector import (
+    BooleanSelector,
     NumberSelector,
     NumberSelectorConfig,
     NumberSelectorMode,
@@ -23,7 +25,7 @@ from homeassistant.helpers.selector import (
 )
 
 from .api import MyHubAuthError, MyHubClient, MyHubConnectionError
-from .const import DEFAULT_SCAN_INTERVAL, DOMAIN
+from .const import CONF_PUSH, DEFAULT_PUSH, DEFAULT_SCAN_INTERVAL, DOMAIN
 
 
 class MyHubConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -39,7 +41,11 @@ class MyHubConfigFlow(ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             # Validate connection
-            client = MyHubClient(user_input[CONF_HOST], user_input[CONF_API_KEY])
+            client = MyHubClient(
+                async_get_clientsession(self.hass),
+                user_input[CONF_HOST],
+                user_input[CONF_API_KEY],
+            )
             try:
                 hub_info = await client.async_get_hub_info()
             except MyHubAuthError:
@@ -57,8 +63,6 @@ class MyHubConfigFlow(ConfigFlow, domain=DOMAIN):
                     title=hub_info.get("name", "My Hub"),
                     data=user_input,
                 )
-            finally:
-                await client.async_close()
 
         return self.async_show_form(
             step_id="user",
@@ -84,7 +88,11 @@ class MyHubConfigFlow(ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             # Validate new settings
-            client = MyHubClient(user_input[CONF_HOST], user_input[CONF_API_KEY])
+            client = MyHubClient(
+                async_get_clientsession(self.hass),
+                user_input[CONF_HOST],
+                user_input[CONF_API_KEY],
+            )
             try:
                 await client.async_get_hub_info()
             except MyHubAuthError:
@@ -98,8 +106,6 @@ class MyHubConfigFlow(ConfigFlow, domain=DOMAIN):
                     entry,
                     data_updates=user_input,
                 )
-            finally:
-                await client.async_close()
 
         return self.async_show_form(
             step_id="reconfigure",
@@ -155,6 +161,10 @@ class MyHubOptionsFlow(OptionsFlow):
                             unit_of_measurement="seconds",
                         )
                     ),
+                    vol.Optional(
+                        CONF_PUSH,
+                        default=self.config_entry.options.get(CONF_PUSH, DEFAULT_PUSH),
+                    ): BooleanSelector(),
                 }
             ),
         )
@@ -8,9 +8,37 @@ _LOGGER = getLogger(__name__)
 
 # Configuration
 CONF_HUB_ID = "hub_id"
+CONF_PUSH = "push"
 
 # Defaults
 DEFAULT_SCAN_INTERVAL = 30
+REQUEST_REFRESH_COOLDOWN = 1.0  # seconds, refresh requests within are coalesced
+DEVICE_REFRESH_COOLDOWN = 0.2  # seconds, targeted device refreshes within are coalesced
+MAX_DEVICE_REFRESHES = 5  # more devices pending than this: one hub poll instead
+HUB_INFO_REFRESH_INTERVAL = 3600  # seconds, hub name/model/firmware change rarely
+
+# Devices missing from the hub's list are unavailable at first; they (and their
+# entities) are only removed once missing for this many polls and seconds
+DEVICE_REMOVAL_MISSED_POLLS = 3
+DEVICE_REMOVAL_DELAY = 600  # seconds
+
+# Adaptive polling
+FAST_SCAN_INTERVAL = 5  # seconds, while a user is changing things
+FAST_SCAN_DURATION = 60  # seconds of fast polling after a user action
+MAX_BACKOFF_INTERVAL = 600  # seconds, cap while the hub is unreachable
+MAX_BACKOFF_EXPONENT = 10  # doublings counted, enough to reach the cap
+STABLE_POLLS_PER_STEP = 5  # unchanged polls before slowing down one step
+MAX_STABLE_FACTOR = 4  # stable hubs are polled at most 4x slower
+SCAN_INTERVAL_JITTER = 0.1  # +/-10% so several hubs don't poll in lockstep
+
+# Push updates
+DEFAULT_PUSH = True
+RECONCILE_SCAN_INTERVAL = 300  # seconds, safety-net poll while events arrive
+PUSH_RETRY_INTERVAL = 30  # seconds before reconnecting a dropped event stream
+
+# Diagnostics
+DIAGNOSTICS_SAMPLE_SIZE = 25  # devices included in config entry diagnostics
+REFRESH_TIMING_WINDOW = 20  # recent refresh durations kept for diagnostics
 
 # Platforms
 PLATFORMS = ["sensor", "binary_sensor", "switch"]
@@ -1,15 +1,53 @@
 """DataUpdateCoordinator for My Smart Hub."""
 from __future__ import annotations
 
+import asyncio
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
 from datetime import timedelta
+import random
+import time
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .api import HubDevice, MyHubApiError, MyHubClient
-from .const import _LOGGER, DEFAULT_SCAN_INTERVAL, DOMAIN
+from .api import HubDevice, MyHubApiError, MyHubClient, MyHubNotFoundError
+from .const import (
+    _LOGGER,
+    DEFAULT_SCAN_INTERVAL,
+    DEVICE_REFRESH_COOLDOWN,
+    DEVICE_REMOVAL_DELAY,
+    DEVICE_REMOVAL_MISSED_POLLS,
+    DOMAIN,
+    FAST_SCAN_DURATION,
+    FAST_SCAN_INTERVAL,
+    HUB_INFO_REFRESH_INTERVAL,
+    MAX_BACKOFF_EXPONENT,
+    MAX_BACKOFF_INTERVAL,
+    MAX_DEVICE_REFRESHES,
+    MAX_STABLE_FACTOR,
+    PUSH_RETRY_INTERVAL,
+    RECONCILE_SCAN_INTERVAL,
+    REFRESH_TIMING_WINDOW,
+    REQUEST_REFRESH_COOLDOWN,
+    SCAN_INTERVAL_JITTER,
+    STABLE_POLLS_PER_STEP,
+)
+
+
+@dataclass(slots=True)
+class MissingDevice:
+    """A device the hub stopped reporting, still in the device registry."""
+
+    since: float
+    polls: int = 0
+    # False if it vanished with most other devices: never removed automatically
+    removable: bool = True
 
 
 class MyHubCoordinator(DataUpdateCoordinator[dict[str, HubDevice]]):
@@ -24,31 +62,444 @@ class MyHubCoordinator(DataUpdateCoordinator[dict[str, HubDevice]]):
         entry: ConfigEntry,
     ) -> None:
         """Initialize coordinator."""
+        self._base_interval: float = entry.options.get(
+            "scan_interval", DEFAULT_SCAN_INTERVAL
+        )
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(
-                seconds=entry.options.get("scan_interval", DEFAULT_SCAN_INTERVAL)
+            update_interval=timedelta(seconds=self._base_interval),
+            # Only notify entities when a refresh actually changed the data
+            always_update=False,
+            # Coalesce refresh requests after commands into one trailing poll
+            request_refresh_debouncer=Debouncer(
+                hass,
+                _LOGGER,
+                cooldown=REQUEST_REFRESH_COOLDOWN,
+                immediate=False,
             ),
         )
         self.client = client
         self.config_entry = entry
         self.hub_info: dict[str, Any] = {}
+        self._hub_info_fetched_at = 0.0
+        # Monotonic time the current data was requested from the hub
+        self.data_fetched_at = 0.0
+        self._device_fetched_at: dict[str, float] = {}
+        self._device_listeners: dict[str, list[CALLBACK_TYPE]] = {}
+        # Devices waiting for a coalesced targeted refresh
+        self._pending_device_refreshes: set[str] = set()
+        self._device_refresh_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=DEVICE_REFRESH_COOLDOWN,
+            immediate=False,
+            function=self._async_refresh_pending_devices,
+        )
+        # Devices that appeared in the last refresh, for the platforms to add
+        self.new_device_ids: tuple[str, ...] = ()
+        # Devices missing from the hub's list, unavailable until they return
+        # or are removed
+        self._missing_devices: dict[str, MissingDevice] = {}
+
+        # Adaptive polling state
+        self._failures = 0
+        self._stable_polls = 0
+        self._fast_until = 0.0
+
+        # Push (event stream) state
+        self._push_connected = False
+        self._push_events = 0
+
+        # Performance counters for diagnostics
+        self.state_writes = 0  # incremented by entities writing their state
+        self._refreshes = 0
+        self._failed_refreshes = 0
+        self._refresh_durations: deque[float] = deque(maxlen=REFRESH_TIMING_WINDOW)
+        self._last_payload_size: int | None = None
 
     async def _async_update_data(self) -> dict[str, HubDevice]:
         """Fetch data from API."""
+        self.new_device_ids = ()
+        fetch_started = time.monotonic()
+        hub_info_due = (
+            not self.hub_info
+            or fetch_started - self._hub_info_fetched_at >= HUB_INFO_REFRESH_INTERVAL
+        )
+        try:
+            # Get devices (None when unchanged since the last poll), plus the
+            # hub info on its own, much slower schedule
+            if hub_info_due:
+                hub_info, payloads = await asyncio.gather(
+                    self._async_get_hub_info(),
+                    self.client.async_get_devices_if_modified(),
+                )
+            else:
+                payloads = await self.client.async_get_devices_if_modified()
+
+        except MyHubApiError as err:
+            self._failures += 1
+            self._failed_refreshes += 1
+            self._adapt_interval()
+            raise UpdateFailed(f"Error communicating with hub: {err}") from err
+
+        if hub_info_due and hub_info is not None:
+            self._hub_info_fetched_at = fetch_started
+            if hub_info != self.hub_info:
+                if self.hub_info:
+                    self._async_update_hub_device(hub_info)
+                self.hub_info = hub_info
+
+        self.data_fetched_at = fetch_started
+
+        if payloads is None and self.data is not None:
+            data = self.data
+        else:
+            data = self._merge_devices(payloads or [], fetch_started)
+            self._last_payload_size = self.client.response_size("/api/devices")
+        if self._missing_devices:
+            self._async_remove_missing_devices(fetch_started)
+
+        self._failures = 0
+        self._stable_polls = self._stable_polls + 1 if data is self.data else 0
+        self._adapt_interval()
+        self._refreshes += 1
+        self._refresh_durations.append(time.monotonic() - fetch_started)
+        return data
+
+    async def _async_get_hub_info(self) -> dict[str, Any] | None:
+        """Fetch hub info; once known, a failed refresh keeps the old info."""
         try:
-            # Get hub info (less frequently if needed)
+            return await self.client.async_get_hub_info()
+        except MyHubApiError as err:
             if not self.hub_info:
-                self.hub_info = await self.client.async_get_hub_info()
+                raise
+            _LOGGER.debug("Keeping previous hub info: %s", err)
+            return None
+
+    @callback
+    def _async_update_hub_device(self, hub_info: dict[str, Any]) -> None:
+        """Update the hub's device registry entry if its info changed."""
+        device_registry = dr.async_get(self.hass)
+        device = device_registry.async_get_device(
+            identifiers={(DOMAIN, self.config_entry.entry_id)}
+        )
+        if device is None:
+            return
+        changes = {
+            key: value
+            for key, value in (
+                ("name", hub_info.get("name", "My Hub")),
+                ("model", hub_info.get("model", "Hub")),
+                ("sw_version", hub_info.get("firmware")),
+            )
+            if getattr(device, key) != value
+        }
+        if changes:
+            device_registry.async_update_device(device.id, **changes)
+
+    def _adapt_interval(self) -> None:
+        """Pick the next poll interval from recent hub behaviour.
+
+        Back off exponentially while the hub is failing, poll rarely while the
+        event stream is up, poll fast for a while after user actions and slow
+        down while nothing changes.
+        """
+        if self._failures:
+            # Exponent clamped: 2**1024 overflows a float scan_interval, and
+            # the cap is reached long before that anyway
+            seconds = min(
+                self._base_interval * 2 ** min(self._failures, MAX_BACKOFF_EXPONENT),
+                MAX_BACKOFF_INTERVAL,
+            )
+        elif self._push_connected:
+            # Events keep the data current; polls only reconcile missed ones
+            seconds = RECONCILE_SCAN_INTERVAL
+        elif time.monotonic() < self._fast_until:
+            seconds = FAST_SCAN_INTERVAL
+        else:
+            factor = min(
+                1 + self._stable_polls // STABLE_POLLS_PER_STEP, MAX_STABLE_FACTOR
+            )
+            seconds = self._base_interval * factor
+
+        jitter = random.uniform(1 - SCAN_INTERVAL_JITTER, 1 + SCAN_INTERVAL_JITTER)
+        self.update_interval = timedelta(seconds=seconds * jitter)
+
+    @callback
+    def async_note_user_action(self) -> None:
+        """Poll faster for a while after a user changed something."""
+        self._fast_until = time.monotonic() + FAST_SCAN_DURATION
+        self._stable_polls = 0
+        self._adapt_interval()
+        # Re-arm the pending poll with the shorter interval
+        self._schedule_refresh()
+
+    def polling_diagnostics(self) -> dict[str, Any]:
+        """Return the adaptive polling state for diagnostics."""
+        return {
+            "base_scan_interval": self._base_interval,
+            "effective_scan_interval": round(self.update_interval.total_seconds(), 1),
+            "consecutive_failures": self._failures,
+            "stable_polls": self._stable_polls,
+            "fast_polling": time.monotonic() < self._fast_until,
+            "push_connected": self._push_connected,
+            "push_events": self._push_events,
+            "missing_devices": len(self._missing_devices),
+        }
+
+    @callback
+    def async_start_push(self) -> None:
+        """Follow the hub's event stream in the background."""
+        self.config_entry.async_create_background_task(
+            self.hass, self._async_run_push(), f"{DOMAIN} event stream"
+        )
 
-            # Get all devices
-            devices = await self.client.async_get_devices()
-            return {device.id: device for device in devices}
+    async def _async_run_push(self) -> None:
+        """Keep the event stream connected, polling normally while it's down."""
+        while True:
+            try:
+                await self.client.async_listen_events(
+                    self._async_handle_event, self._async_push_connected
+                )
+            except MyHubNotFoundError:
+                _LOGGER.info("Hub has no event stream, using polling only")
+                return
+            except MyHubApiError as err:
+                reason = str(err)
+            except Exception as err:  # noqa: BLE001 - never stay in reconcile mode
+                _LOGGER.exception("Unexpected error in the event stream")
+                reason = repr(err)
+            if self._push_connected:
+                _LOGGER.warning("Event stream lost, polling until back: %s", reason)
+                self._push_connected = False
+                self._adapt_interval()
+                self._schedule_refresh()
+            await asyncio.sleep(PUSH_RETRY_INTERVAL)
 
+    @callback
+    def _async_push_connected(self) -> None:
+        """Switch to reconciliation polling once the event stream is up."""
+        self._push_connected = True
+        self._adapt_interval()
+        # Catch up on whatever changed while the stream was down
+        self.hass.async_create_task(self.async_request_refresh())
+
+    @callback
+    def _async_handle_event(self, event: dict[str, Any]) -> None:
+        """Apply an event from the hub's event stream."""
+        self._push_events += 1
+        event_type = event.get("type")
+        if event_type in ("device_added", "device_removed"):
+            # Picked up (with entities) by a poll, like any paired device
+            self.hass.async_create_task(self.async_request_refresh())
+            return
+        if event_type != "device" or not isinstance(device_id := event.get("id"), str):
+            return
+        if (device := self.get_device(device_id)) is None:
+            self.hass.async_create_task(self.async_request_refresh())
+            return
+        try:
+            updated = device.apply_delta(event)
+        except (TypeError, ValueError, AttributeError) as err:
+            _LOGGER.debug("Skipping malformed event for %s: %s", device_id, err)
+            return
+        self._async_set_device(device_id, updated, time.monotonic())
+
+    def performance_diagnostics(self) -> dict[str, Any]:
+        """Return refresh timings and counters for diagnostics."""
+        stats: dict[str, Any] = {
+            "refreshes": self._refreshes,
+            "failed_refreshes": self._failed_refreshes,
+            "last_payload_size": self._last_payload_size,
+            "state_writes": self.state_writes,
+        }
+        if durations := self._refresh_durations:
+            stats["last_refresh_duration"] = round(durations[-1], 4)
+            stats["mean_refresh_duration"] = round(sum(durations) / len(durations), 4)
+            stats["max_refresh_duration"] = round(max(durations), 4)
+        if self._refreshes:
+            stats["state_writes_per_refresh"] = round(
+                self.state_writes / self._refreshes, 1
+            )
+        return stats
+
+    def _merge_devices(
+        self, payloads: list[dict[str, Any]], fetched_at: float
+    ) -> dict[str, HubDevice]:
+        """Merge device payloads into the current data.
+
+        Unchanged devices keep their existing HubDevice; only changed, new or
+        removed devices touch the mapping, which is copied on first change.
+        When nothing changed the current mapping itself is returned, so the
+        coordinator skips notifying listeners. New devices are recorded in
+        new_device_ids. Devices missing from the payload are dropped from the
+        data (their entities become unavailable) and only removed from the
+        device registry by _async_remove_missing_devices, later. Devices
+        updated (by an event or targeted refresh) after fetched_at are newer
+        than the payload and kept.
+        """
+        current = self.data or {}
+        data: dict[str, HubDevice] | None = None
+        new_device_ids: list[str] = []
+
+        for payload in payloads:
+            device = current.get(payload["id"])
+            if device is not None and (
+                device.matches(payload)
+                or self._device_fetched_at.get(payload["id"], 0.0) > fetched_at
+            ):
+                continue
+            if data is None:
+                data = dict(current)
+            if device is None:
+                # A missing device that returns still has its entities
+                if self._missing_devices.pop(payload["id"], None) is None:
+                    new_device_ids.append(payload["id"])
+            data[payload["id"]] = HubDevice.from_dict(payload)
+
+        if len(payloads) != len(data if data is not None else current):
+            # Some devices are missing from the hub's list
+            seen = {payload["id"] for payload in payloads}
+            data = data or dict(current)
+            missing = [device_id for device_id in data if device_id not in seen]
+            # An empty list or most devices gone at once is more likely a
+            # rebooting hub than that many devices unpaired
+            removable = bool(payloads) and 2 * len(missing) <= len(current)
+            if not removable:
+                _LOGGER.warning(
+                    "Hub reported %s of %s devices missing, keeping them until "
+                    "they return or are removed manually",
+                    len(missing),
+                    len(current),
+                )
+            for device_id in missing:
+                del data[device_id]
+                self._missing_devices[device_id] = MissingDevice(
+                    fetched_at, removable=removable
+                )
+
+        if self.data is not None:
+            self.new_device_ids = tuple(new_device_ids)
+        return current if data is None else data
+
+    @callback
+    def _async_remove_missing_devices(self, fetched_at: float) -> None:
+        """Remove devices missing for long enough after a successful poll."""
+        removed: list[str] = []
+        for device_id, missing in self._missing_devices.items():
+            missing.polls += 1
+            if (
+                missing.removable
+                and missing.polls >= DEVICE_REMOVAL_MISSED_POLLS
+                and fetched_at - missing.since >= DEVICE_REMOVAL_DELAY
+            ):
+                removed.append(device_id)
+        if removed:
+            for device_id in removed:
+                del self._missing_devices[device_id]
+            self._async_remove_devices(removed)
+
+    @callback
+    def async_forget_device(self, device_id: str) -> None:
+        """Forget a missing device removed by the user; new if it returns."""
+        self._missing_devices.pop(device_id, None)
+
+    @callback
+    def _async_remove_devices(self, device_ids: Iterable[str]) -> None:
+        """Remove devices the hub no longer reports, with their entities."""
+        device_registry = dr.async_get(self.hass)
+        for device_id in device_ids:
+            self._device_fetched_at.pop(device_id, None)
+            device = device_registry.async_get_device(
+                identifiers={(DOMAIN, device_id)}
+            )
+            if device is not None:
+                # Entity registry entries of the device are removed with it
+                device_registry.async_update_device(
+                    device.id, remove_config_entry_id=self.config_entry.entry_id
+                )
+
+    async def async_refresh_device(self, device_id: str) -> None:
+        """Fetch a single device and notify only that device's entities.
+
+        Cheaper than a full hub poll after a command on one device.
+        Raises MyHubApiError if the hub can't be reached.
+        """
+        fetch_started = time.monotonic()
+        payload = await self.client.async_get_device(device_id)
+
+        device = self.data.get(device_id)
+        if device is None or not device.matches(payload):
+            device = HubDevice.from_dict(payload)
+        self._async_set_device(device_id, device, fetch_started)
+
+    async def async_request_device_refresh(self, device_id: str) -> None:
+        """Refresh a device soon, coalesced with other devices' requests.
+
+        A scene's commands finish together: each device is fetched once after
+        DEVICE_REFRESH_COOLDOWN, or the whole hub is polled once when more
+        than MAX_DEVICE_REFRESHES devices are pending.
+        """
+        self._pending_device_refreshes.add(device_id)
+        await self._device_refresh_debouncer.async_call()
+
+    async def _async_refresh_pending_devices(self) -> None:
+        """Fetch the devices scheduled for a targeted refresh."""
+        device_ids, self._pending_device_refreshes = (
+            self._pending_device_refreshes,
+            set(),
+        )
+        if len(device_ids) > MAX_DEVICE_REFRESHES:
+            await self.async_request_refresh()
+            return
+        await asyncio.gather(
+            *(self._async_try_refresh_device(device_id) for device_id in device_ids)
+        )
+
+    async def _async_try_refresh_device(self, device_id: str) -> None:
+        """Refresh a device, leaving it to the next poll if that fails."""
+        try:
+            await self.async_refresh_device(device_id)
         except MyHubApiError as err:
-            raise UpdateFailed(f"Error communicating with hub: {err}") from err
+            _LOGGER.debug("Could not refresh %s: %s", device_id, err)
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending device refreshes too."""
+        await super().async_shutdown()
+        self._device_refresh_debouncer.async_shutdown()
+
+    @callback
+    def _async_set_device(
+        self, device_id: str, device: HubDevice, fetched_at: float
+    ) -> None:
+        """Store fresh data for one device and notify only its entities."""
+        self._device_fetched_at[device_id] = fetched_at
+        if device is not self.data.get(device_id):
+            self.data = {**self.data, device_id: device}
+        for update_callback in list(self._device_listeners.get(device_id, ())):
+            update_callback()
+
+    @callback
+    def async_add_device_listener(
+        self, device_id: str, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for targeted refreshes of one device."""
+        listeners = self._device_listeners.setdefault(device_id, [])
+        listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            listeners.remove(update_callback)
+            if not listeners:
+                self._device_listeners.pop(device_id, None)
+
+        return remove_listener
+
+    def fetched_at(self, device_id: str) -> float:
+        """Return the monotonic time a device's current data was requested."""
+        return max(self.data_fetched_at, self._device_fetched_at.get(device_id, 0.0))
 
     def get_device(self, device_id: str) -> HubDevice | None:
         """Get a specific device by ID."""
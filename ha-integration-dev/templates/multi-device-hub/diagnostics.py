@@ -1,40 +1,91 @@
 """Diagnostics for My Smart Hub."""
 from __future__ import annotations
 
+from collections import Counter
+from itertools import islice
 from typing import Any
 
 from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_API_KEY
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceEntry
 
-from .const import DOMAIN
+from .api import HubDevice
+from .const import DIAGNOSTICS_SAMPLE_SIZE, DOMAIN
 from .coordinator import MyHubCoordinator
 
 TO_REDACT = {CONF_API_KEY}
 
 
+def _serialize_device(device: HubDevice) -> dict[str, Any]:
+    """Serialize one device."""
+    return {
+        "name": device.name,
+        "model": device.model,
+        "firmware": device.firmware,
+        "online": device.online,
+        "sensors": device.sensors,
+        "switches": device.switches,
+    }
+
+
+def _summarize_devices(devices: dict[str, HubDevice]) -> dict[str, Any]:
+    """Summarize all devices without serializing each of them."""
+    online = sum(device.online for device in devices.values())
+    return {
+        "count": len(devices),
+        "online": online,
+        "online_ratio": round(online / len(devices), 3) if devices else None,
+        "models": dict(Counter(device.model for device in devices.values())),
+        "firmware": dict(Counter(device.firmware for device in devices.values())),
+    }
+
+
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> dict[str, Any]:
-    """Return diagnostics for config entry."""
+    """Return diagnostics for config entry.
+
+    Large hubs would produce multi-megabyte dumps, so only summary statistics
+    and an evenly spread sample of devices are included. Full data for any
+    device is available from that device's own diagnostics.
+    """
     coordinator: MyHubCoordinator = hass.data[DOMAIN][entry.entry_id]
+    devices = coordinator.data
 
-    # Serialize devices
-    devices_data = {}
-    for device_id, device in coordinator.data.items():
-        devices_data[device_id] = {
-            "name": device.name,
-            "model": device.model,
-            "firmware": device.firmware,
-            "online": device.online,
-            "sensors": device.sensors,
-            "switches": device.switches,
-        }
+    step = max(1, len(devices) // DIAGNOSTICS_SAMPLE_SIZE)
+    sample = islice(devices.items(), 0, None, step)
+    devices_data = {
+        device_id: _serialize_device(device)
+        for device_id, device in islice(sample, DIAGNOSTICS_SAMPLE_SIZE)
+    }
 
     return {
         "entry": async_redact_data(entry.as_dict(), TO_REDACT),
         "hub_info": coordinator.hub_info,
+        "summary": _summarize_devices(devices),
+        "devices_sampled": len(devices_data),
         "devices": devices_data,
         "last_update_success": coordinator.last_update_success,
+        "polling": coordinator.polling_diagnostics(),
+        "performance": coordinator.performance_diagnostics(),
+    }
+
+
+async def async_get_device_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry, device: DeviceEntry
+) -> dict[str, Any]:
+    """Return diagnostics for one child device (or the hub)."""
+    coordinator: MyHubCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    for domain, identifier in device.identifiers:
+        if domain != DOMAIN:
+            continue
+        if (hub_device := coordinator.get_device(identifier)) is not None:
+            return {"device_id": identifier, **_serialize_device(hub_device)}
+
+    return {
+        "hub_info": coordinator.hub_info,
+        "summary": _summarize_devices(coordinator.data),
     }
@@ -1,19 +1,58 @@
 """Base entity for My Smart Hub."""
 from __future__ import annotations
 
+from collections.abc import Callable, Sequence
+from typing import Any, Generic, Protocol, TypeVar
+
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .api import HubDevice
+from .api import DeviceSchema, HubDevice
 from .coordinator import MyHubCoordinator
 from .const import DOMAIN
 
 
+class _DeviceDescription(Protocol):
+    """Entity description that may or may not apply to a device."""
+
+    exists_fn: Callable[[HubDevice], bool]
+
+
+_DescriptionT = TypeVar("_DescriptionT", bound=_DeviceDescription)
+
+
+class DescriptionIndex(Generic[_DescriptionT]):
+    """Entity descriptions applying to a device, evaluated once per model.
+
+    exists_fn must only depend on the device's model and key layout.
+    """
+
+    def __init__(self, descriptions: Sequence[_DescriptionT]) -> None:
+        """Initialize the index."""
+        self._descriptions = descriptions
+        self._applicable: dict[tuple[str, DeviceSchema], tuple[_DescriptionT, ...]] = {}
+
+    def for_device(self, device: HubDevice) -> tuple[_DescriptionT, ...]:
+        """Return the descriptions applying to a device."""
+        key = (device.model, device.schema)
+        if (applicable := self._applicable.get(key)) is None:
+            applicable = self._applicable[key] = tuple(
+                description
+                for description in self._descriptions
+                if description.exists_fn(device)
+            )
+        return applicable
+
+
 class MyHubEntity(CoordinatorEntity[MyHubCoordinator]):
     """Base entity for My Smart Hub devices."""
 
     _attr_has_entity_name = True
 
+    # (available, value) last written to the state machine
+    _last_state: tuple[bool, Any] | None = None
+
     def __init__(
         self,
         coordinator: MyHubCoordinator,
@@ -22,27 +61,70 @@ class MyHubEntity(CoordinatorEntity[MyHubCoordinator]):
         """Initialize entity."""
         super().__init__(coordinator)
         self._device_id = device_id
+        # Direct reference to the device's data, refreshed on every update so
+        # property reads don't look it up in the coordinator's mapping
+        self._device: HubDevice | None = coordinator.data[device_id]
 
         # Device info with hub as parent
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, device_id)},
-            name=self.device.name,
+            name=self._device.name,
             manufacturer="My Hub Manufacturer",
-            model=self.device.model,
-            sw_version=self.device.firmware,
+            model=self._device.model,
+            sw_version=self._device.firmware,
             via_device=(DOMAIN, coordinator.config_entry.entry_id),
         )
 
     @property
     def device(self) -> HubDevice:
-        """Return the device."""
-        return self.coordinator.data[self._device_id]
+        """Return the device (only valid while the entity is available)."""
+        return self._device
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return (
-            super().available
-            and self._device_id in self.coordinator.data
-            and self.coordinator.data[self._device_id].online
+        return super().available and self._device is not None and self._device.online
+
+    def _state_value(self) -> Any:
+        """Return the value this entity writes (native_value, is_on...).
+
+        Defaults to the formatted state; platforms override it with their raw
+        value, which is cheaper to compute.
+        """
+        return self.state
+
+    def _current_state(self) -> tuple[bool, Any]:
+        """Return availability and value as compared between refreshes."""
+        available = self.available
+        return (available, self._state_value() if available else None)
+
+    async def async_added_to_hass(self) -> None:
+        """Register for targeted device refreshes and record the state."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_device_listener(
+                self._device_id, self._handle_coordinator_update
+            )
         )
+        self._device = self.coordinator.data.get(self._device_id)
+        self._last_state = self._current_state()
+
+    @callback
+    def _async_write_state_if_changed(self) -> None:
+        """Write state only if availability or value changed."""
+        self._device = self.coordinator.data.get(self._device_id)
+        state = self._current_state()
+        if state == self._last_state:
+            return
+        self._last_state = state
+        self.coordinator.state_writes += 1
+        self.async_write_ha_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator.
+
+        A refresh notifies every entity of the hub; with hundreds of devices
+        most of them are unchanged, so skip their no-op state writes.
+        """
+        self._async_write_state_if_changed()
@@ -1,7 +1,7 @@
 """Sensor platform for My Smart Hub."""
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from typing import Any
 
@@ -13,14 +13,14 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
 
 from .api import HubDevice
 from .coordinator import MyHubCoordinator
 from .const import DOMAIN
-from .entity import MyHubEntity
+from .entity import DescriptionIndex, MyHubEntity
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -28,6 +28,7 @@ class MyHubSensorEntityDescription(SensorEntityDescription):
     """Describes My Hub sensor entity."""
 
     value_fn: Callable[[HubDevice], StateType]
+    # Evaluated once per device model, see DescriptionIndex
     exists_fn: Callable[[HubDevice], bool] = lambda _: True
 
 
@@ -38,8 +39,8 @@ SENSOR_DESCRIPTIONS: tuple[MyHubSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda device: device.sensors.get("temperature"),
-        exists_fn=lambda device: "temperature" in device.sensors,
+        value_fn=lambda device: device.sensor("temperature"),
+        exists_fn=lambda device: device.has_sensor("temperature"),
     ),
     MyHubSensorEntityDescription(
         key="humidity",
@@ -47,8 +48,8 @@ SENSOR_DESCRIPTIONS: tuple[MyHubSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.HUMIDITY,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda device: device.sensors.get("humidity"),
-        exists_fn=lambda device: "humidity" in device.sensors,
+        value_fn=lambda device: device.sensor("humidity"),
+        exists_fn=lambda device: device.has_sensor("humidity"),
     ),
     MyHubSensorEntityDescription(
         key="battery",
@@ -56,11 +57,13 @@ SENSOR_DESCRIPTIONS: tuple[MyHubSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.BATTERY,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda device: device.sensors.get("battery"),
-        exists_fn=lambda device: "battery" in device.sensors,
+        value_fn=lambda device: device.sensor("battery"),
+        exists_fn=lambda device: device.has_sensor("battery"),
     ),
 )
 
+SENSOR_INDEX = DescriptionIndex(SENSOR_DESCRIPTIONS)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -70,15 +73,23 @@ async def async_setup_entry(
     """Set up sensor platform."""
     coordinator: MyHubCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[MyHubSensor] = []
-    for device_id, device in coordinator.data.items():
-        for description in SENSOR_DESCRIPTIONS:
-            if description.exists_fn(device):
-                entities.append(
-                    MyHubSensor(coordinator, device_id, description)
-                )
+    def _create_entities(device_ids: Iterable[str]) -> list[MyHubSensor]:
+        """Create entities for the given devices."""
+        entities: list[MyHubSensor] = []
+        for device_id in device_ids:
+            device = coordinator.data[device_id]
+            for description in SENSOR_INDEX.for_device(device):
+                entities.append(MyHubSensor(coordinator, device_id, description))
+        return entities
+
+    @callback
+    def _async_add_new_devices() -> None:
+        """Add entities for devices that appeared since the last refresh."""
+        if coordinator.new_device_ids:
+            async_add_entities(_create_entities(coordinator.new_device_ids))
 
-    async_add_entities(entities)
+    async_add_entities(_create_entities(coordinator.data))
+    entry.async_on_unload(coordinator.async_add_listener(_async_add_new_devices))
 
 
 class MyHubSensor(MyHubEntity, SensorEntity):
@@ -101,3 +112,7 @@ class MyHubSensor(MyHubEntity, SensorEntity):
     def native_value(self) -> StateType:
         """Return sensor value."""
         return self.entity_description.value_fn(self.device)
+
+    def _state_value(self) -> Any:
+        """Return the value compared for change detection."""
+        return self.native_value
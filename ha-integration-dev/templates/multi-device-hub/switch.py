@@ -1,8 +1,11 @@
 """Switch platform for My Smart Hub."""
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
+from datetime import datetime
+import math
+import time
 from typing import Any
 
 from homeassistant.components.switch import (
@@ -11,13 +14,15 @@ from homeassistant.components.switch import (
     SwitchEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 
-from .api import HubDevice
+from .api import HubDevice, MyHubApiError
 from .coordinator import MyHubCoordinator
 from .const import DOMAIN
-from .entity import MyHubEntity
+from .entity import DescriptionIndex, MyHubEntity
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -25,6 +30,7 @@ class MyHubSwitchEntityDescription(SwitchEntityDescription):
     """Describes My Hub switch entity."""
 
     switch_key: str
+    # Evaluated once per device model, see DescriptionIndex
     exists_fn: Callable[[HubDevice], bool] = lambda _: True
 
 
@@ -34,16 +40,18 @@ SWITCH_DESCRIPTIONS: tuple[MyHubSwitchEntityDescription, ...] = (
         translation_key="power",
         switch_key="power",
         device_class=SwitchDeviceClass.OUTLET,
-        exists_fn=lambda device: "power" in device.switches,
+        exists_fn=lambda device: device.has_switch("power"),
     ),
     MyHubSwitchEntityDescription(
         key="night_light",
         translation_key="night_light",
         switch_key="night_light",
-        exists_fn=lambda device: "night_light" in device.switches,
+        exists_fn=lambda device: device.has_switch("night_light"),
     ),
 )
 
+SWITCH_INDEX = DescriptionIndex(SWITCH_DESCRIPTIONS)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -53,15 +61,23 @@ async def async_setup_entry(
     """Set up switch platform."""
     coordinator: MyHubCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[MyHubSwitch] = []
-    for device_id, device in coordinator.data.items():
-        for description in SWITCH_DESCRIPTIONS:
-            if description.exists_fn(device):
-                entities.append(
-                    MyHubSwitch(coordinator, device_id, description)
-                )
+    def _create_entities(device_ids: Iterable[str]) -> list[MyHubSwitch]:
+        """Create entities for the given devices."""
+        entities: list[MyHubSwitch] = []
+        for device_id in device_ids:
+            device = coordinator.data[device_id]
+            for description in SWITCH_INDEX.for_device(device):
+                entities.append(MyHubSwitch(coordinator, device_id, description))
+        return entities
+
+    @callback
+    def _async_add_new_devices() -> None:
+        """Add entities for devices that appeared since the last refresh."""
+        if coordinator.new_device_ids:
+            async_add_entities(_create_entities(coordinator.new_device_ids))
 
-    async_add_entities(entities)
+    async_add_entities(_create_entities(coordinator.data))
+    entry.async_on_unload(coordinator.async_add_listener(_async_add_new_devices))
 
 
 class MyHubSwitch(MyHubEntity, SwitchEntity):
@@ -69,6 +85,12 @@ class MyHubSwitch(MyHubEntity, SwitchEntity):
 
     entity_description: MyHubSwitchEntityDescription
 
+    # State shown between a command and the data confirming it
+    _optimistic_is_on: bool | None = None
+    # Monotonic time the command completed; data fetched after it confirms
+    _optimistic_since = math.inf
+    _cancel_optimistic_expiry: CALLBACK_TYPE | None = None
+
     def __init__(
         self,
         coordinator: MyHubCoordinator,
@@ -83,18 +105,83 @@ class MyHubSwitch(MyHubEntity, SwitchEntity):
     @property
     def is_on(self) -> bool:
         """Return switch state."""
-        return self.device.switches.get(self.entity_description.switch_key, False)
+        if self._optimistic_is_on is not None:
+            return self._optimistic_is_on
+        return self.device.switch(self.entity_description.switch_key)
+
+    def _state_value(self) -> Any:
+        """Return the value compared for change detection."""
+        return self.is_on
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on switch."""
-        await self.coordinator.client.async_turn_on(
-            self._device_id, self.entity_description.switch_key
-        )
-        await self.coordinator.async_request_refresh()
+        await self._async_set_state(True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off switch."""
-        await self.coordinator.client.async_turn_off(
-            self._device_id, self.entity_description.switch_key
+        await self._async_set_state(False)
+
+    async def _async_set_state(self, state: bool) -> None:
+        """Show the new state immediately, then send the command.
+
+        The optimistic state is confirmed (or rolled back) by the first data
+        fetched after the command: a targeted refresh of this device rather
+        than a poll of the whole hub, coalesced with those of other devices
+        switched at the same time.
+        """
+        self._set_optimistic(state)
+        self._async_write_state_if_changed()
+        try:
+            await self.coordinator.client.async_set_switch(
+                self._device_id, self.entity_description.switch_key, state
+            )
+        except MyHubApiError as err:
+            self._clear_optimistic()
+            self._async_write_state_if_changed()
+            raise HomeAssistantError(
+                f"Failed to switch {self.entity_id}: {err}"
+            ) from err
+        self._optimistic_since = time.monotonic()
+        self.coordinator.async_note_user_action()
+        await self.coordinator.async_request_device_refresh(self._device_id)
+
+    def _set_optimistic(self, state: bool) -> None:
+        """Hold an optimistic state until confirmed or expired."""
+        self._clear_optimistic()
+        self._optimistic_is_on = state
+        # Unconfirmed after two polls: the hub ignored it, show its real state
+        self._cancel_optimistic_expiry = async_call_later(
+            self.hass,
+            2 * self.coordinator.update_interval.total_seconds(),
+            self._async_expire_optimistic,
         )
-        await self.coordinator.async_request_refresh()
+
+    def _clear_optimistic(self) -> None:
+        """Drop the optimistic state."""
+        self._optimistic_is_on = None
+        self._optimistic_since = math.inf
+        if self._cancel_optimistic_expiry is not None:
+            self._cancel_optimistic_expiry()
+            self._cancel_optimistic_expiry = None
+
+    @callback
+    def _async_expire_optimistic(self, _now: datetime) -> None:
+        """Fall back to coordinator data when a command was never confirmed."""
+        self._cancel_optimistic_expiry = None
+        self._clear_optimistic()
+        self._async_write_state_if_changed()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Confirm or roll back the optimistic state with fresh data."""
+        if (
+            self._optimistic_is_on is not None
+            and self.coordinator.fetched_at(self._device_id) >= self._optimistic_since
+        ):
+            self._clear_optimistic()
+        super()._handle_coordinator_update()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel the optimistic state expiry."""
+        self._clear_optimistic()
+        await super().async_will_remove_from_hass()
@@ -0,0 +1,99 @@
+"""Raw frame capture for My Integration.
+
+Records frames exactly as received, with their arrival time, so a production
+stream can be replayed locally (scripts/replay_push_server.py).
+
+File format: MAGIC, then per frame a RECORD header (seconds since the first
+frame, frame type, payload length) followed by the raw payload.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+import struct
+import time
+
+import aiohttp
+
+MAGIC = b"PUSHCAP1"
+RECORD = struct.Struct("<dBI")
+FRAME_TEXT = 1
+FRAME_BINARY = 2
+
+
+class FrameRecorder:
+    """Buffer frames in memory; write() appends the buffer to the file.
+
+    record() runs in the event loop and never touches the disk, write() is
+    blocking and meant for the executor.
+    """
+
+    def __init__(self, path: Path, max_bytes: int) -> None:
+        """Initialize the recorder."""
+        self.path = path
+        self._max_bytes = max_bytes
+        self._buffer = bytearray()
+        self._started: float | None = None
+        # The first write of a session replaces a file left by an earlier one
+        self._file_started = False
+        self.recorded_bytes = 0
+        self.full = False
+
+    @property
+    def pending(self) -> int:
+        """Return the number of buffered bytes not written yet."""
+        return len(self._buffer)
+
+    def record(self, msg: aiohttp.WSMessage) -> None:
+        """Buffer a TEXT or BINARY frame."""
+        if self.full:
+            return
+        if msg.type is aiohttp.WSMsgType.TEXT:
+            frame_type, payload = FRAME_TEXT, msg.data.encode()
+        elif msg.type is aiohttp.WSMsgType.BINARY:
+            frame_type, payload = FRAME_BINARY, msg.data
+        else:
+            return
+        size = RECORD.size + len(payload)
+        if self.recorded_bytes + size > self._max_bytes:
+            self.full = True
+            return
+        now = time.monotonic()
+        if self._started is None:
+            self._started = now
+        self._buffer += RECORD.pack(now - self._started, frame_type, len(payload))
+        self._buffer += payload
+        self.recorded_bytes += size
+
+    def take_buffer(self) -> bytes:
+        """Return and clear the buffered records."""
+        data, self._buffer = bytes(self._buffer), bytearray()
+        return data
+
+    def write(self, data: bytes) -> None:
+        """Append records to this session's capture file (blocking).
+
+        Timestamps restart with every recorder, so the first write starts a
+        new file rather than appending to one from a previous run.
+        """
+        if self._file_started:
+            with open(self.path, "ab") as file:
+                file.write(data)
+            return
+        with open(self.path, "wb") as file:
+            file.write(MAGIC)
+            file.write(data)
+        self._file_started = True
+
+
+def read_capture(path: Path) -> Iterator[tuple[float, int, bytes]]:
+    """Yield (seconds since first frame, frame type, payload) from a capture."""
+    data = memoryview(path.read_bytes())
+    if bytes(data[: len(MAGIC)]) != MAGIC:
+        raise ValueError(f"{path} is not a frame capture")
+    offset = len(MAGIC)
+    while offset + RECORD.size <= len(data):
+        timestamp, frame_type, length = RECORD.unpack_from(data, offset)
+        offset += RECORD.size
+        yield timestamp, frame_type, bytes(data[offset : offset + length])
+        offset += length
@@ -2,3 +2,38 @@
 from typing import Final
 
 DOMAIN: Final = "my_integration"
+
+# Connection supervision
+HEARTBEAT_INTERVAL: Final = 30  # seconds between pings; a missed pong drops the link
+RECONNECT_MIN_DELAY: Final = 1  # seconds before the first reconnect attempt
+RECONNECT_MAX_DELAY: Final = 300  # seconds, cap for the exponential backoff
+RECONNECT_JITTER: Final = 0.2  # +/-20% so many clients don't reconnect in lockstep
+
+# Delta mode: messages are partial updates deep-merged into the current state
+# and only entities bound to a changed key are updated. Enable only if every
+# entity derives from MyPushEntity: a plain CoordinatorEntity then only sees
+# full updates (the first message after connecting). Off, every message is
+# the full state and updates every entity.
+MERGE_DELTAS: Final = False
+
+# Update coalescing: messages within this window (seconds) are merged into one
+# update carrying the latest values; 0 updates on every message
+COALESCE_WINDOW: Final = 0.1
+# Optional per-key limits in updates per second (delta mode), e.g.
+# {"meter.power": 1.0}
+KEY_MAX_RATES: Final[dict[str, float]] = {}
+
+# Format of BINARY frames: "json", "msgpack" (needs msgpack), "cbor" (needs
+# cbor2) or None to ignore them; TEXT frames are always JSON
+BINARY_FORMAT: Final[str | None] = None
+INVALID_FRAME_LOG_INTERVAL: Final = 60  # seconds between invalid-frame warnings
+
+# Bounded queue between the socket reader and message processing
+QUEUE_SIZE: Final = 1000  # messages
+QUEUE_OVERFLOW: Final = "merge"  # "merge" into the newest message, or "drop_oldest"
+
+# Raw frame capture for replaying a stream locally; file name in the config
+# directory, e.g. "my_integration_capture.bin", or None to disable
+CAPTURE_FILE: Final[str | None] = None
+CAPTURE_MAX_BYTES: Final = 50_000_000  # stop recording beyond this size
+CAPTURE_FLUSH_BYTES: Final = 64_000  # buffered bytes written per executor job
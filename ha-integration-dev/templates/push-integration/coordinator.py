@@ -2,24 +2,123 @@
 from __future__ import annotations
 
 import asyncio
-import json
+from collections import deque
 import logging
+import math
+from pathlib import Path
+import random
+import time
+from typing import Any
 
 import aiohttp
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .const import DOMAIN
+from .capture import FrameRecorder
+from .const import (
+    BINARY_FORMAT,
+    CAPTURE_FILE,
+    CAPTURE_FLUSH_BYTES,
+    CAPTURE_MAX_BYTES,
+    COALESCE_WINDOW,
+    DOMAIN,
+    HEARTBEAT_INTERVAL,
+    INVALID_FRAME_LOG_INTERVAL,
+    KEY_MAX_RATES,
+    MERGE_DELTAS,
+    QUEUE_OVERFLOW,
+    QUEUE_SIZE,
+    RECONNECT_JITTER,
+    RECONNECT_MAX_DELAY,
+    RECONNECT_MIN_DELAY,
+)
+from .decoder import FrameDecodeError, FrameDecoder, RateLimitedLogger
 
 _LOGGER = logging.getLogger(__name__)
 
+STATE_CONNECTED = "connected"
+STATE_CONNECTING = "connecting"
+STATE_DISCONNECTED = "disconnected"
+
+_MISSING = object()
+
+
+def merge_delta(
+    current: dict[str, Any], delta: dict[str, Any], changed: set[str], prefix: str = ""
+) -> dict[str, Any]:
+    """Return current with delta deep-merged into it.
+
+    Paths of changed values are added to changed as dotted keys
+    ("meter.power"), down to the leaves when a whole subtree is added or
+    replaced. Unchanged subtrees are shared rather than copied, and current
+    itself is returned if nothing changed.
+    """
+    merged: dict[str, Any] | None = None
+    for key, value in delta.items():
+        old = current.get(key, _MISSING)
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            if isinstance(old, dict):
+                new = merge_delta(old, value, changed, f"{path}.")
+                if new is old:
+                    continue
+            else:
+                # Merged against {} so every nested path is recorded
+                new = merge_delta({}, value, changed, f"{path}.")
+                changed.add(path)
+        elif old == value and old is not _MISSING:
+            continue
+        else:
+            new = value
+            changed.add(path)
+            if isinstance(old, dict):
+                # Nested values replaced by a plain one are gone
+                _add_paths(old, changed, f"{path}.")
+        if merged is None:
+            merged = dict(current)
+        merged[key] = new
+    return current if merged is None else merged
+
+
+def _add_paths(data: dict[str, Any], changed: set[str], prefix: str) -> None:
+    """Add the dotted path of every value nested in data to changed."""
+    for key, value in data.items():
+        changed.add(f"{prefix}{key}")
+        if isinstance(value, dict):
+            _add_paths(value, changed, f"{prefix}{key}.")
+
+
+def _rate_limited_key(path: str) -> str | None:
+    """Return the KEY_MAX_RATES key covering a dotted path, if any."""
+    while True:
+        if path in KEY_MAX_RATES:
+            return path
+        if "." not in path:
+            return None
+        path = path.rpartition(".")[0]
+
 
 class PushCoordinator(DataUpdateCoordinator[dict]):
-    """WebSocket coordinator for push updates."""
+    """WebSocket coordinator for push updates.
+
+    The connection is supervised: when it drops (error, close or a missed
+    heartbeat pong) it is re-established with exponential backoff and
+    jitter, and the full state is requested again.
+
+    With MERGE_DELTAS, messages are merged into the current state and only
+    entities bound to a changed key (async_add_key_listener, as MyPushEntity
+    does) are notified; plain coordinator listeners only see full updates.
+    Notifications are coalesced over COALESCE_WINDOW and limited per key by
+    KEY_MAX_RATES, so a flooding device causes one state write per window.
+
+    The socket reader only decodes frames and queues them; a separate task
+    processes the bounded queue, so a busy event loop delays processing but
+    not socket reads and heartbeats.
+    """
 
     config_entry: ConfigEntry
 
@@ -36,41 +135,334 @@ class PushCoordinator(DataUpdateCoordinator[dict]):
         self._host = entry.data[CONF_HOST]
         self._ws: aiohttp.ClientWebSocketResponse | None = None
         self._listen_task: asyncio.Task | None = None
+        self._process_task: asyncio.Task | None = None
+        self._queue: deque[dict[str, Any]] = deque()
+        self._queue_ready = asyncio.Event()
+        self.max_queue_depth = 0
+        self.queue_dropped = 0
+        self.queue_merged = 0
+        self._decoder = FrameDecoder(BINARY_FORMAT)
+        # A misbehaving device can't flood the log with invalid frames
+        self._invalid_frames = RateLimitedLogger(_LOGGER, INVALID_FRAME_LOG_INTERVAL)
+        self._recorder: FrameRecorder | None = None
+        self._capture_job: asyncio.Future[None] | None = None
+        if CAPTURE_FILE:
+            self._recorder = FrameRecorder(
+                Path(hass.config.path(CAPTURE_FILE)), CAPTURE_MAX_BYTES
+            )
+
+        # Connection state, exposed through diagnostics
+        self.connection_state = STATE_DISCONNECTED
+        self.reconnects = 0
+        self._connected_since: float | None = None
+        self._last_disconnect: str | None = None
+
+        # Listeners bound to a (dotted) key of the state
+        self._key_listeners: dict[str, list[CALLBACK_TYPE]] = {}
+        self.messages = 0
+        self.key_notifications = 0
+
+        # Coalescing: changes received but not notified yet
+        self._pending_changed: set[str] = set()
+        self._pending_full: dict[str, Any] | None = None
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._key_notified_at: dict[str, float] = {}
+        self.flushes = 0
 
     async def async_setup(self) -> None:
         """Set up WebSocket connection."""
+        await self._async_connect()
+        self._listen_task = asyncio.create_task(self._run())
+        self._process_task = asyncio.create_task(self._process())
+
+    async def _async_connect(self) -> None:
+        """Open the WebSocket and request the full state."""
+        self.connection_state = STATE_CONNECTING
         url = f"ws://{self._host}/ws"
-        self._ws = await self._session.ws_connect(url)
-        self._listen_task = asyncio.create_task(self._listen())
+        try:
+            self._ws = await self._session.ws_connect(
+                url, heartbeat=HEARTBEAT_INTERVAL
+            )
+            await self._async_resync()
+        except BaseException:
+            self.connection_state = STATE_DISCONNECTED
+            if self._ws is not None:
+                await self._ws.close()
+            raise
+        self.connection_state = STATE_CONNECTED
+        self._connected_since = time.monotonic()
+
+    async def _async_resync(self) -> None:
+        """Ask the device for its full state after (re)connecting.
+
+        Updates may have been missed while disconnected. Adjust the request
+        to your device's protocol.
+        """
+        await self._ws.send_json({"type": "get_state"})
+
+    async def _run(self) -> None:
+        """Listen, and reconnect whenever the connection is lost.
+
+        Nothing supervises this task, so it must never end on an error.
+        """
+        while True:
+            try:
+                reason = await self._listen()
+                self._last_disconnect = reason
+                self.connection_state = STATE_DISCONNECTED
+                _LOGGER.warning(
+                    "Connection to %s lost (%s), reconnecting", self._host, reason
+                )
+                # Entities become unavailable until the state is resynced
+                self._queue.clear()
+                self._async_cancel_flush()
+                self.last_update_success = False
+                self.async_update_listeners()
+
+                await self._async_reconnect()
+                self.reconnects += 1
+                _LOGGER.info("Reconnected to %s", self._host)
+            except Exception:  # noqa: BLE001
+                _LOGGER.exception("Unexpected error supervising %s", self._host)
+                # A dead socket ends _listen() right away, which reconnects
+                await asyncio.sleep(RECONNECT_MIN_DELAY)
+
+    async def _async_reconnect(self) -> None:
+        """Reconnect with exponential backoff and jitter."""
+        attempt = 0
+        while True:
+            delay = min(RECONNECT_MIN_DELAY * 2**attempt, RECONNECT_MAX_DELAY)
+            await asyncio.sleep(
+                delay * random.uniform(1 - RECONNECT_JITTER, 1 + RECONNECT_JITTER)
+            )
+            try:
+                await self._async_connect()
+            except (aiohttp.ClientError, TimeoutError) as err:
+                _LOGGER.debug("Reconnect to %s failed: %s", self._host, err)
+                attempt += 1
+            except Exception:  # noqa: BLE001
+                # e.g. ConnectionResetError when the device drops right
+                # after the handshake; keep retrying
+                _LOGGER.exception("Unexpected error reconnecting to %s", self._host)
+                attempt += 1
+            else:
+                return
 
-    async def _listen(self) -> None:
-        """Listen for WebSocket messages."""
+    async def _listen(self) -> str:
+        """Listen for WebSocket messages; returns why the connection ended."""
         try:
             async for msg in self._ws:
-                if msg.type == aiohttp.WSMsgType.TEXT:
+                if msg.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                    if self._recorder:
+                        self._capture(msg)
                     try:
-                        data = json.loads(msg.data)
-                        self.async_set_updated_data(data)
-                    except json.JSONDecodeError:
-                        _LOGGER.warning("Invalid JSON received")
+                        data = self._decoder.decode(msg)
+                    except FrameDecodeError as err:
+                        self._invalid_frames.warning(
+                            "Invalid frame from %s: %s", self._host, err
+                        )
+                        continue
+                    if data is not None:
+                        self._enqueue(data)
                 elif msg.type == aiohttp.WSMsgType.ERROR:
-                    _LOGGER.error("WebSocket error: %s", self._ws.exception())
-                    break
-                elif msg.type == aiohttp.WSMsgType.CLOSED:
-                    break
-        except asyncio.CancelledError:
-            pass
-        except Exception as err:
-            _LOGGER.error("WebSocket error: %s", err)
+                    return f"error: {self._ws.exception()}"
+        except Exception as err:  # noqa: BLE001
+            return f"error: {err}"
+        # Closed by the device, or heartbeat pong missed
+        return f"closed with code {self._ws.close_code}"
+
+    def _capture(self, msg: aiohttp.WSMessage) -> None:
+        """Record a raw frame, writing the buffer out in the executor."""
+        self._recorder.record(msg)
+        if self._recorder.pending >= CAPTURE_FLUSH_BYTES and (
+            self._capture_job is None or self._capture_job.done()
+        ):
+            self._capture_job = self.hass.async_add_executor_job(
+                self._recorder.write, self._recorder.take_buffer()
+            )
+
+    def _enqueue(self, data: dict[str, Any]) -> None:
+        """Queue a message for processing, applying the overflow policy."""
+        if len(self._queue) >= QUEUE_SIZE:
+            if QUEUE_OVERFLOW == "merge":
+                # The newest queued message absorbs this one, no values lost
+                newest = self._queue[-1]
+                self._queue[-1] = (
+                    merge_delta(newest, data, set()) if MERGE_DELTAS else data
+                )
+                self.queue_merged += 1
+                return
+            self._queue.popleft()
+            self.queue_dropped += 1
+        self._queue.append(data)
+        self.max_queue_depth = max(self.max_queue_depth, len(self._queue))
+        self._queue_ready.set()
+
+    async def _process(self) -> None:
+        """Process queued messages, yielding to the reader between batches."""
+        while True:
+            await self._queue_ready.wait()
+            self._queue_ready.clear()
+            processed = 0
+            while self._queue:
+                try:
+                    self._async_handle_message(self._queue.popleft())
+                except Exception:  # noqa: BLE001 - one bad message or listener
+                    _LOGGER.exception("Error processing message from %s", self._host)
+                processed += 1
+                if processed % 100 == 0:
+                    await asyncio.sleep(0)
+
+    @callback
+    def _async_handle_message(self, data: dict[str, Any]) -> None:
+        """Apply a message to the state and schedule notifying listeners."""
+        self.messages += 1
+        if not self.last_update_success or self.data is None:
+            # First message after (re)connecting: update everyone right away
+            self._async_cancel_flush()
+            if MERGE_DELTAS:
+                data = merge_delta(self.data or {}, data, set())
+            self.async_set_updated_data(data)
+            return
+
+        if MERGE_DELTAS:
+            self.data = merge_delta(self.data, data, self._pending_changed)
+            if not self._pending_changed:
+                return
+        else:
+            self._pending_full = data
+
+        if not COALESCE_WINDOW and not KEY_MAX_RATES:
+            self._async_flush()
+            return
+        # A flush already due within the window (not one waiting for a rate
+        # limited key) will carry this change too
+        flush_at = self.hass.loop.time() + COALESCE_WINDOW
+        if self._flush_handle is None or self._flush_handle.when() > flush_at:
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+            self._flush_handle = self.hass.loop.call_at(flush_at, self._async_flush)
+
+    @callback
+    def _async_flush(self) -> None:
+        """Notify listeners of everything received since the last flush."""
+        self._flush_handle = None
+        self.flushes += 1
+        if self._pending_full is not None:
+            data, self._pending_full = self._pending_full, None
+            self.async_set_updated_data(data)
+            return
+
+        changed, self._pending_changed = self._pending_changed, set()
+        if KEY_MAX_RATES:
+            now = time.monotonic()
+            held: set[str] = set()
+            retry_at = math.inf
+            # Decided once per key, so all its changed paths go out together
+            allowed: dict[str, bool] = {}
+            for path in changed:
+                if (key := _rate_limited_key(path)) is None:
+                    continue
+                if key not in allowed:
+                    allowed_at = self._key_notified_at.get(key, -math.inf) + (
+                        1 / KEY_MAX_RATES[key]
+                    )
+                    allowed[key] = allowed_at <= now
+                    if allowed[key]:
+                        self._key_notified_at[key] = now
+                    else:
+                        retry_at = min(retry_at, allowed_at)
+                if not allowed[key]:
+                    held.add(path)
+            if held:
+                # Keep them until their key may be updated again
+                changed -= held
+                self._pending_changed = held
+                self._flush_handle = self.hass.loop.call_later(
+                    max(retry_at - now, COALESCE_WINDOW), self._async_flush
+                )
+
+        if changed:
+            self._async_notify_keys(changed)
+
+    @callback
+    def _async_cancel_flush(self) -> None:
+        """Drop pending notifications; a full update follows."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending_changed = set()
+        self._pending_full = None
+
+    @callback
+    def _async_notify_keys(self, changed: set[str]) -> None:
+        """Call the listeners of changed keys and of their parent keys."""
+        keys: set[str] = set()
+        for path in changed:
+            keys.add(path)
+            while "." in path:
+                path = path.rpartition(".")[0]
+                keys.add(path)
+        for key in keys & self._key_listeners.keys():
+            for update_callback in list(self._key_listeners[key]):
+                self.key_notifications += 1
+                update_callback()
+
+    @callback
+    def async_add_key_listener(
+        self, key: str, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for changes of one key (dotted for nested keys) of the state."""
+        listeners = self._key_listeners.setdefault(key, [])
+        listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            listeners.remove(update_callback)
+            if not listeners:
+                self._key_listeners.pop(key, None)
+
+        return remove_listener
+
+    def connection_diagnostics(self) -> dict[str, Any]:
+        """Return the connection state for diagnostics."""
+        return {
+            "state": self.connection_state,
+            "reconnects": self.reconnects,
+            "connected_for": (
+                round(time.monotonic() - self._connected_since)
+                if self.connection_state == STATE_CONNECTED and self._connected_since
+                else None
+            ),
+            "last_disconnect": self._last_disconnect,
+            "messages": self.messages,
+            "key_notifications": self.key_notifications,
+            "flushes": self.flushes,
+            "invalid_frames": self._invalid_frames.count,
+            "queue_depth": len(self._queue),
+            "max_queue_depth": self.max_queue_depth,
+            "queue_dropped": self.queue_dropped,
+            "queue_merged": self.queue_merged,
+            "capture_bytes": self._recorder.recorded_bytes if self._recorder else None,
+        }
 
     async def async_shutdown(self) -> None:
         """Shut down coordinator."""
-        if self._listen_task:
-            self._listen_task.cancel()
-            try:
-                await self._listen_task
-            except asyncio.CancelledError:
-                pass
+        self._async_cancel_flush()
+        for task in (self._listen_task, self._process_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
 
         if self._ws:
             await self._ws.close()
+
+        if self._recorder:
+            if self._capture_job:
+                await self._capture_job
+            await self.hass.async_add_executor_job(
+                self._recorder.write, self._recorder.take_buffer()
+            )
@@ -0,0 +1,106 @@
+"""WebSocket frame decoding for My Integration."""
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+import time
+from typing import Any
+
+import aiohttp
+
+try:
+    # Bundled with Home Assistant; parses str and UTF-8 bytes directly
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+try:
+    import msgpack
+except ImportError:  # Only needed for devices sending MessagePack frames
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:  # Only needed for devices sending CBOR frames
+    cbor2 = None
+
+BINARY_FORMATS = ("json", "msgpack", "cbor")
+
+_TEXT = aiohttp.WSMsgType.TEXT
+_BINARY = aiohttp.WSMsgType.BINARY
+
+
+class FrameDecodeError(Exception):
+    """Frame could not be decoded into a message."""
+
+
+def _binary_loader(binary_format: str | None) -> Callable[[bytes], Any] | None:
+    """Return the loader for BINARY frames, None to ignore them."""
+    if binary_format is None:
+        return None
+    if binary_format == "json":
+        # Parsed from the UTF-8 bytes, no intermediate str
+        return json_loads
+    if binary_format == "msgpack":
+        if msgpack is None:
+            raise ValueError("MessagePack frames need the msgpack package")
+        return msgpack.unpackb
+    if binary_format == "cbor":
+        if cbor2 is None:
+            raise ValueError("CBOR frames need the cbor2 package")
+        return cbor2.loads
+    raise ValueError(f"Unknown binary format {binary_format}, use {BINARY_FORMATS}")
+
+
+class FrameDecoder:
+    """Decode TEXT frames as JSON and BINARY frames as binary_format.
+
+    JSON is parsed with orjson when available, straight from the frame's
+    str or bytes.
+    """
+
+    def __init__(self, binary_format: str | None = None) -> None:
+        """Initialize the decoder."""
+        self._binary_loader = _binary_loader(binary_format)
+
+    def decode(self, msg: aiohttp.WSMessage) -> dict[str, Any] | None:
+        """Return the message in a frame, None for frames to skip."""
+        if msg.type is _TEXT:
+            loader: Callable[[Any], Any] = json_loads
+        elif msg.type is _BINARY and self._binary_loader:
+            loader = self._binary_loader
+        else:
+            return None
+        try:
+            data = loader(msg.data)
+        except Exception as err:  # noqa: BLE001 - each library has its own errors
+            raise FrameDecodeError(f"{type(err).__name__}: {err}") from err
+        if not isinstance(data, dict):
+            raise FrameDecodeError(f"Expected an object, got {type(data).__name__}")
+        return data
+
+
+class RateLimitedLogger:
+    """Log a recurring warning at most once per interval, counting the rest."""
+
+    def __init__(self, logger: logging.Logger, interval: float) -> None:
+        """Initialize the logger."""
+        self._logger = logger
+        self._interval = interval
+        self._logged_at = -interval
+        self._suppressed = 0
+        self.count = 0
+
+    def warning(self, msg: str, *args: Any) -> None:
+        """Log msg unless a warning was logged within the interval."""
+        self.count += 1
+        now = time.monotonic()
+        if now - self._logged_at < self._interval:
+            self._suppressed += 1
+            return
+        if self._suppressed:
+            msg += " (%d similar messages suppressed)"
+            args = (*args, self._suppressed)
+        self._logger.warning(msg, *args)
+        self._logged_at = now
+        self._suppressed = 0
@@ -0,0 +1,21 @@
+"""Diagnostics for My Integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from . import MyConfigEntry
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: MyConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for config entry."""
+    coordinator = entry.runtime_data
+
+    return {
+        "connection": coordinator.connection_diagnostics(),
+        "last_update_success": coordinator.last_update_success,
+        "data": coordinator.data,
+    }
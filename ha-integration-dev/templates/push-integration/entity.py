@@ -0,0 +1,43 @@
+"""Base entity for My Integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import PushCoordinator
+
+
+class MyPushEntity(CoordinatorEntity[PushCoordinator]):
+    """Entity bound to one (dotted) key of the pushed state.
+
+    Besides full-state updates, it's only notified when its own key changes,
+    so a fast-changing key doesn't fan out to every entity.
+    """
+
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator: PushCoordinator, key: str) -> None:
+        """Initialize entity."""
+        super().__init__(coordinator)
+        self._key = key
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{key}"
+
+    async def async_added_to_hass(self) -> None:
+        """Also listen for changes of this entity's key."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_key_listener(
+                self._key, self._handle_coordinator_update
+            )
+        )
+
+    @property
+    def value(self) -> Any:
+        """Return the value of this entity's key, None if not (yet) reported."""
+        value: Any = self.coordinator.data
+        for part in self._key.split("."):
+            if not isinstance(value, dict):
+                return None
+            value = value.get(part)
+        return value
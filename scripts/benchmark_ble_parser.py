@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+BLE Advertisement Parser Benchmark
+==================================
+Microbenchmark of advertisement payload decoding for the
+bluetooth-integration template: hand-written slicing (with and without the
+hex() debug formatting it used to pay on every advertisement), struct on
+sliced copies and on memoryviews, and the template's PayloadLayout and
+ParserRegistry, over generated sample payloads.
+
+Usage:
+    python benchmark_ble_parser.py                     # 1000 payloads
+    python benchmark_ble_parser.py --payloads 10000 --rounds 100
+
+Generated by ha-integration@aurora-smart-home
+https://github.com/tonylofgren/aurora-smart-home
+"""
+
+import argparse
+import importlib
+import random
+import struct
+import sys
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Tuple
+
+TEMPLATE_DIR = (
+    Path(__file__).resolve().parent.parent
+    / "ha-integration-dev" / "templates" / "bluetooth-integration"
+)
+PACKAGE = "my_bluetooth_device"
+LAYOUT = struct.Struct("<Bh")
+
+
+def load_parser_module(path: Path) -> ModuleType:
+    """Import the template's parser module (no Home Assistant needed)."""
+    package = ModuleType(PACKAGE)
+    package.__path__ = [str(path)]
+    sys.modules[PACKAGE] = package
+    return importlib.import_module(f"{PACKAGE}.parser")
+
+
+def sample_payloads(count: int, seed: int) -> List[bytes]:
+    """Return manufacturer payloads: battery, temperature, vendor trailer."""
+    rng = random.Random(seed)
+    return [
+        LAYOUT.pack(rng.randint(0, 100), rng.randint(-400, 850))
+        + rng.randbytes(rng.randint(0, 17))
+        for _ in range(count)
+    ]
+
+
+def slicing_with_hex(payload: bytes) -> Dict[str, Any]:
+    """The template's former approach: hex() for the debug log, then slicing."""
+    payload.hex()
+    return {
+        "battery": payload[0],
+        "temperature": int.from_bytes(payload[1:3], "little", signed=True) / 10,
+    }
+
+
+def slicing(payload: bytes) -> Dict[str, Any]:
+    """Slicing without the hex() call."""
+    return {
+        "battery": payload[0],
+        "temperature": int.from_bytes(payload[1:3], "little", signed=True) / 10,
+    }
+
+
+def struct_on_slice(payload: bytes) -> Dict[str, Any]:
+    """Precompiled struct on a sliced copy."""
+    battery, temperature = LAYOUT.unpack(payload[: LAYOUT.size])
+    return {"battery": battery, "temperature": temperature / 10}
+
+
+def struct_on_memoryview(payload: bytes) -> Dict[str, Any]:
+    """Precompiled struct reading a memoryview in place."""
+    battery, temperature = LAYOUT.unpack_from(memoryview(payload))
+    return {"battery": battery, "temperature": temperature / 10}
+
+
+def time_parser(parser: Callable[[Any], Any], inputs: List[Any], rounds: int) -> float:
+    """Return the best per-payload time over rounds passes, in seconds."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for item in inputs:
+            parser(item)
+        best = min(best, time.perf_counter() - start)
+    return best / len(inputs)
+
+
+def build_cases(
+    payloads: List[bytes], parser_module: ModuleType
+) -> List[Tuple[str, Callable[[Any], Any], List[Any]]]:
+    """Return (name, parser, inputs) for every decoding approach."""
+    layout = parser_module.PayloadLayout(
+        "<Bh",
+        parser_module.Field("battery"),
+        parser_module.Field("temperature", divisor=10),
+    )
+    registry = parser_module.ParserRegistry(
+        manufacturer={parser_module.MANUFACTURER_ID: layout}
+    )
+    manufacturer_id = parser_module.MANUFACTURER_ID
+    advertisements = [({manufacturer_id: payload}, {}) for payload in payloads]
+
+    # What the coordinator does per advertisement: compare the raw payloads
+    # with the last ones, and only parse the ones that changed
+    parse_changed = registry.parse_changed
+    last_payloads = [None] * len(registry)
+
+    def registry_changed(advertisement):
+        manufacturer_data, service_data = advertisement
+        return parse_changed(manufacturer_data, service_data, last_payloads)
+
+    repeated_payloads = [None] * len(registry)
+    parse_changed(*advertisements[0], repeated_payloads)
+    repeated = [advertisements[0]] * len(advertisements)
+
+    def registry_repeated(advertisement):
+        # Parsing is skipped, only the comparison is paid
+        manufacturer_data, service_data = advertisement
+        return parse_changed(manufacturer_data, service_data, repeated_payloads)
+
+    # Sanity check: the layout decodes the same values as slicing
+    for payload in payloads[:10]:
+        expected = slicing(payload)
+        result = layout.parse(payload)
+        assert result["battery"] == expected["battery"]
+        assert result["temperature"] == expected["temperature"]
+
+    return [
+        ("slicing + hex() (old)", slicing_with_hex, payloads),
+        ("slicing", slicing, payloads),
+        ("struct on slice copy", struct_on_slice, payloads),
+        ("struct on memoryview", struct_on_memoryview, payloads),
+        ("PayloadLayout.parse", layout.parse, payloads),
+        ("ParserRegistry changed ad", registry_changed, advertisements),
+        ("ParserRegistry repeated ad", registry_repeated, repeated),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Microbenchmark BLE advertisement payload decoding",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python benchmark_ble_parser.py
+  python benchmark_ble_parser.py --payloads 10000 --rounds 100
+        """,
+    )
+    parser.add_argument("--payloads", type=int, default=1000, help="Sample payloads")
+    parser.add_argument("--rounds", type=int, default=50, help="Timed passes per parser")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed")
+    parser.add_argument(
+        "--template", default=str(TEMPLATE_DIR),
+        help="Path to the bluetooth-integration template",
+    )
+
+    args = parser.parse_args()
+
+    payloads = sample_payloads(args.payloads, args.seed)
+    cases = build_cases(payloads, load_parser_module(Path(args.template)))
+    baseline = None
+
+    print("=" * 66)
+    print("BLE Advertisement Parser Benchmark")
+    print("=" * 66)
+    print(f"Payloads:   {len(payloads)} "
+          f"({sum(map(len, payloads)) / len(payloads):.0f} B avg)")
+    print()
+    print(f"{'parser':<32} {'us/payload':>10} {'payloads/s':>12} {'speedup':>8}")
+    for name, parse, inputs in cases:
+        per_payload = time_parser(parse, inputs, args.rounds)
+        baseline = baseline or per_payload
+        print(
+            f"{name:<32} {per_payload * 1e6:>10.3f} {1 / per_payload:>12,.0f} "
+            f"{baseline / per_payload:>7.1f}x"
+        )
+    print("=" * 66)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Push Frame Decode Benchmark
+===========================
+Microbenchmark of WebSocket frame decoding for the push-integration
+template: stdlib json vs. orjson (from str and from bytes) for JSON frames,
+and MessagePack / CBOR for binary frames, over recorded messages.
+
+Also runs the template's FrameDecoder itself, so its overhead on top of the
+raw loaders is visible. Loaders whose package isn't installed are skipped.
+
+Usage:
+    python benchmark_decode.py                         # bundled fixtures
+    python benchmark_decode.py --fixtures capture.jsonl --rounds 200
+
+Generated by ha-integration@aurora-smart-home
+https://github.com/tonylofgren/aurora-smart-home
+"""
+
+import argparse
+import importlib
+import json
+import sys
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import aiohttp
+except ImportError:
+    print("aiohttp not installed. Run: pip install aiohttp")
+    sys.exit(1)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+FIXTURES = SCRIPT_DIR / "fixtures" / "push_messages.jsonl"
+TEMPLATE_DIR = SCRIPT_DIR.parent / "ha-integration-dev" / "templates" / "push-integration"
+PACKAGE = "my_push_integration"
+
+
+def load_messages(path: Path) -> List[Dict[str, Any]]:
+    """Load recorded messages, one JSON object per line."""
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def load_decoder_module(path: Path) -> Optional[ModuleType]:
+    """Import the template's decoder module (needs Home Assistant)."""
+    package = ModuleType(PACKAGE)
+    package.__path__ = [str(path)]
+    sys.modules[PACKAGE] = package
+    try:
+        return importlib.import_module(f"{PACKAGE}.decoder")
+    except ImportError as err:
+        print(f"Skipping FrameDecoder ({err})")
+        return None
+
+
+def time_loader(loader: Callable[[Any], Any], frames: List[Any], rounds: int) -> float:
+    """Return the best per-frame decode time over rounds passes, in seconds."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for frame in frames:
+            loader(frame)
+        best = min(best, time.perf_counter() - start)
+    return best / len(frames)
+
+
+def build_cases(
+    messages: List[Dict[str, Any]], decoder_module: Optional[ModuleType]
+) -> List[Tuple[str, Callable[[Any], Any], List[Any]]]:
+    """Return (name, loader, encoded frames) for every available decoder."""
+    text = [json.dumps(m, separators=(",", ":")) for m in messages]
+    raw = [t.encode() for t in text]
+    cases = [
+        ("json.loads(str)", json.loads, text),
+        ("json.loads(bytes)", json.loads, raw),
+    ]
+    if orjson is not None:
+        cases.append(("orjson.loads(str)", orjson.loads, text))
+        cases.append(("orjson.loads(bytes)", orjson.loads, raw))
+    if msgpack is not None:
+        cases.append(
+            ("msgpack.unpackb", msgpack.unpackb, [msgpack.packb(m) for m in messages])
+        )
+    if cbor2 is not None:
+        cases.append(("cbor2.loads", cbor2.loads, [cbor2.dumps(m) for m in messages]))
+
+    if decoder_module is not None:
+        decoder = decoder_module.FrameDecoder("json")
+        text_frames = [aiohttp.WSMessage(aiohttp.WSMsgType.TEXT, t, None) for t in text]
+        binary_frames = [aiohttp.WSMessage(aiohttp.WSMsgType.BINARY, r, None) for r in raw]
+        cases.append(("FrameDecoder TEXT", decoder.decode, text_frames))
+        cases.append(("FrameDecoder BINARY json", decoder.decode, binary_frames))
+        if msgpack is not None:
+            packed = [
+                aiohttp.WSMessage(aiohttp.WSMsgType.BINARY, msgpack.packb(m), None)
+                for m in messages
+            ]
+            cases.append(
+                ("FrameDecoder BINARY msgpack",
+                 decoder_module.FrameDecoder("msgpack").decode, packed)
+            )
+    return cases
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Microbenchmark push frame decoders over recorded messages",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python benchmark_decode.py
+  python benchmark_decode.py --fixtures capture.jsonl --rounds 200
+        """,
+    )
+    parser.add_argument(
+        "--fixtures", default=str(FIXTURES), help="JSONL file of recorded messages"
+    )
+    parser.add_argument("--rounds", type=int, default=50, help="Timed passes per decoder")
+    parser.add_argument(
+        "--template", default=str(TEMPLATE_DIR), help="Path to the push-integration template"
+    )
+
+    args = parser.parse_args()
+
+    messages = load_messages(Path(args.fixtures))
+    cases = build_cases(messages, load_decoder_module(Path(args.template)))
+    baseline = None
+    size = sum(len(json.dumps(m, separators=(",", ":"))) for m in messages)
+
+    print("=" * 64)
+    print("Push Frame Decode Benchmark")
+    print("=" * 64)
+    print(f"Messages:   {len(messages)} ({size / len(messages):.0f} B avg as JSON)")
+    print()
+    print(f"{'decoder':<30} {'us/frame':>10} {'frames/s':>12} {'speedup':>8}")
+    for name, loader, frames in cases:
+        per_frame = time_loader(loader, frames, args.rounds)
+        baseline = baseline or per_frame
+        print(
+            f"{name:<30} {per_frame * 1e6:>10.2f} {1 / per_frame:>12,.0f} "
+            f"{baseline / per_frame:>7.1f}x"
+        )
+    for name, module in (("orjson", orjson), ("msgpack", msgpack), ("cbor2", cbor2)):
+        if module is None:
+            print(f"({name} not installed, skipped)")
+    print("=" * 64)
+
+
+if __name__ == "__main__":
+    main()
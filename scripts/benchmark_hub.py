@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+"""
+Multi-Device Hub Benchmark
+==========================
+Measures how the multi-device-hub integration template behaves with many
+child devices, running its coordinator and entity platforms against the
+local stand-in hub from mock_hub_server.py.
+
+Reports refresh latency, allocations per refresh, entity state writes and
+the cost of devices being paired and unpaired at runtime.
+Requires Home Assistant and aiohttp in the current environment.
+
+Usage:
+    python benchmark_hub.py                          # 500 devices, 20 refreshes
+    python benchmark_hub.py --devices 2000 --iterations 50
+    python benchmark_hub.py --latency 20 --failure-rate 0.05
+
+Generated by ha-integration@aurora-smart-home
+https://github.com/tonylofgren/aurora-smart-home
+"""
+
+import argparse
+import asyncio
+import gc
+import importlib
+import importlib.util
+import json
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, List
+
+try:
+    from homeassistant.const import CONF_API_KEY, CONF_HOST
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers import device_registry as dr
+    from homeassistant.helpers.aiohttp_client import async_get_clientsession
+except ImportError:
+    print("Home Assistant not installed. Run: pip install homeassistant")
+    sys.exit(1)
+
+from mock_hub_server import DEFAULT_API_KEY, MockHub, start_server
+
+TEMPLATE_DIR = (
+    Path(__file__).resolve().parent.parent
+    / "ha-integration-dev" / "templates" / "multi-device-hub"
+)
+PACKAGE = "my_hub"
+
+
+class BenchConfigEntry:
+    """Minimal config entry carrying what the template reads from it."""
+
+    def __init__(self, host: str, api_key: str) -> None:
+        self.entry_id = "benchmark"
+        self.title = "Benchmark Hub"
+        self.data = {CONF_HOST: host, CONF_API_KEY: api_key}
+        self.options: Dict[str, Any] = {}
+        # Refreshes are driven by the benchmark, not the coordinator's timer
+        self.pref_disable_polling = True
+        self._on_unload: List[Any] = []
+
+    def async_on_unload(self, func) -> None:
+        self._on_unload.append(func)
+
+    def async_create_background_task(self, hass, target, name, eager_start=False):
+        task = hass.async_create_background_task(target, name)
+        self.async_on_unload(task.cancel)
+        return task
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"entry_id": self.entry_id, "data": self.data, "options": self.options}
+
+
+def load_template(path: Path) -> ModuleType:
+    """Import the template directory as a package so relative imports work."""
+    spec = importlib.util.spec_from_file_location(
+        PACKAGE, path / "__init__.py", submodule_search_locations=[str(path)]
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[PACKAGE] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Return the pct percentile of values."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def measure_device_memory(api: ModuleType, hub: MockHub) -> Dict[str, int]:
+    """Measure memory and GC-tracked objects retained by a parsed device mapping."""
+    raw = json.dumps({"devices": list(hub.devices.values())})
+    gc.collect()
+    objects_before = len(gc.get_objects())
+    tracemalloc.start()
+    payloads = json.loads(raw)["devices"]
+    devices = {d["id"]: api.HubDevice.from_dict(d) for d in payloads}
+    del payloads
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    objects = len(gc.get_objects()) - objects_before
+    del devices
+    return {"bytes": retained, "objects": objects}
+
+
+async def setup_entities(
+    hass, entry, coordinator, writes: Counter
+) -> Dict[str, List[Any]]:
+    """Run every platform's async_setup_entry and count entity state writes."""
+    const = importlib.import_module(f"{PACKAGE}.const")
+    entities: Dict[str, List[Any]] = {}
+
+    pending: List[asyncio.Task] = []
+    loop = asyncio.get_running_loop()
+
+    for platform in const.PLATFORMS:
+        module = importlib.import_module(f"{PACKAGE}.{platform}")
+        added: List[Any] = []
+
+        # Also called later by the platform for devices paired at runtime
+        def add_entities(new_entities, update_before_add=False, _added=added,
+                         _platform=platform):
+            for entity in new_entities:
+                def write_state(_platform=_platform):
+                    writes[_platform] += 1
+
+                entity.hass = hass
+                entity.async_write_ha_state = write_state
+                pending.append(loop.create_task(entity.async_added_to_hass()))
+                _added.append(entity)
+
+        await module.async_setup_entry(hass, entry, add_entities)
+        entities[platform] = added
+
+    await asyncio.gather(*pending)
+    pending.clear()
+    return entities
+
+
+async def run_churn(
+    hub: MockHub, coordinator, entities: Dict[str, List[Any]], count: int
+) -> Dict[str, Any]:
+    """Pair and unpair devices on the hub and time the refresh picking it up."""
+    entities_before = sum(len(added) for added in entities.values())
+    hub.add_devices(count)
+    hub.remove_devices(count)
+    start = time.perf_counter()
+    await coordinator.async_refresh()
+    latency = time.perf_counter() - start
+    await asyncio.sleep(0)  # let the new entities finish being added
+    return {
+        "latency": latency,
+        "entities_added": sum(len(added) for added in entities.values())
+        - entities_before,
+        "devices": len(coordinator.data),
+    }
+
+
+async def measure_loop_lag(stop: asyncio.Event, lags: List[float]) -> None:
+    """Record how late 10 ms sleeps wake up while the event loop is busy."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.01)
+        lags.append(time.perf_counter() - start - 0.01)
+
+
+async def run_push(
+    hub: MockHub,
+    coordinator,
+    writes: Counter,
+    event_rate: float,
+    duration: float,
+    cooldown: float,
+) -> Dict[str, Any]:
+    """Follow the hub's event stream for a while and count what it causes."""
+    coordinator.async_start_push()
+    for _ in range(100):
+        if coordinator.polling_diagnostics()["push_connected"]:
+            break
+        await asyncio.sleep(0.05)
+    else:
+        return {"connected": False}
+    # Let the catch-up refresh requested on connect run
+    await asyncio.sleep(cooldown + 0.1)
+
+    hub.requests.clear()
+    events_before = coordinator.polling_diagnostics()["push_events"]
+    writes_before = sum(writes.values())
+    lags: List[float] = []
+    stop = asyncio.Event()
+    lag_task = asyncio.ensure_future(measure_loop_lag(stop, lags))
+    hub.events_sent = 0
+    hub.event_rate = event_rate
+    await asyncio.sleep(duration)
+    hub.event_rate = 0
+    await asyncio.sleep(0.1)  # let in-flight events arrive
+    stop.set()
+    await lag_task
+
+    diagnostics = coordinator.polling_diagnostics()
+    return {
+        "connected": True,
+        "events_sent": hub.events_sent,
+        "events_applied": diagnostics["push_events"] - events_before,
+        "writes": sum(writes.values()) - writes_before,
+        "polls": hub.requests.get("/api/devices", 0),
+        "scan_interval": diagnostics["effective_scan_interval"],
+        "loop_lag_p95": percentile(lags, 0.95),
+        "loop_lag_max": max(lags),
+    }
+
+
+async def run_scene(hub: MockHub, switches: List[Any], cooldown: float) -> Dict[str, Any]:
+    """Turn off many switches at once, like a scene, and count hub requests."""
+    hub.requests.clear()
+    start = time.perf_counter()
+    await asyncio.gather(*(switch.async_turn_off() for switch in switches))
+    latency = time.perf_counter() - start
+    # Let the coalesced refresh requested by the switches run
+    await asyncio.sleep(cooldown + 0.5)
+    return {
+        "latency": latency,
+        "commands": sum(n for path, n in hub.requests.items() if "switches" in path),
+        "polls": hub.requests.get("/api/devices", 0),
+        "device_fetches": sum(
+            n
+            for path, n in hub.requests.items()
+            if path.startswith("/api/devices/") and "switches" not in path
+        ),
+    }
+
+
+async def run_benchmark(args) -> None:
+    """Run the benchmark and print a report."""
+    hub = MockHub(
+        device_count=args.devices,
+        latency=args.latency / 1000,
+        change_rate=args.change_rate,
+        seed=args.seed,
+        batch=not args.no_batch,
+    )
+    runner = await start_server(hub)
+    host = "%s:%s" % runner.addresses[0][:2]
+
+    load_template(Path(args.template))
+    api = importlib.import_module(f"{PACKAGE}.api")
+    coordinator_module = importlib.import_module(f"{PACKAGE}.coordinator")
+    const = importlib.import_module(f"{PACKAGE}.const")
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        await dr.async_load(hass)
+        entry = BenchConfigEntry(host, DEFAULT_API_KEY)
+        client = api.MyHubClient(async_get_clientsession(hass), host, DEFAULT_API_KEY)
+        coordinator = coordinator_module.MyHubCoordinator(hass, client, entry)
+
+        start = time.perf_counter()
+        await coordinator.async_refresh()
+        first_refresh = time.perf_counter() - start
+        if not coordinator.last_update_success:
+            print("First refresh failed - check the template and mock hub")
+            sys.exit(1)
+
+        hass.data.setdefault(const.DOMAIN, {})[entry.entry_id] = coordinator
+        writes: Counter = Counter()
+        start = time.perf_counter()
+        entities = await setup_entities(hass, entry, coordinator, writes)
+        entity_setup = time.perf_counter() - start
+        entity_counts = {platform: len(added) for platform, added in entities.items()}
+
+        # Latency pass (failures only injected once setup is done)
+        hub.failure_rate = args.failure_rate
+        hub.requests.clear()
+        latencies: List[float] = []
+        write_counts: List[int] = []
+        failures = 0
+        for _ in range(args.iterations):
+            before = sum(writes.values())
+            start = time.perf_counter()
+            await coordinator.async_refresh()
+            latencies.append(time.perf_counter() - start)
+            write_counts.append(sum(writes.values()) - before)
+            if not coordinator.last_update_success:
+                failures += 1
+        requests = dict(hub.requests)
+        hub.failure_rate = 0
+
+        cooldown = getattr(const, "REQUEST_REFRESH_COOLDOWN", 10.0)
+        scene_switches = entities.get("switch", [])[: args.scene_size]
+        scene = await run_scene(hub, scene_switches, cooldown)
+
+        churn = await run_churn(hub, coordinator, entities, args.churn)
+
+        push = await run_push(
+            hub, coordinator, writes, args.event_rate, args.push_duration, cooldown
+        )
+        for cancel in entry._on_unload:
+            cancel()
+
+        diagnostics_module = importlib.import_module(f"{PACKAGE}.diagnostics")
+        start = time.perf_counter()
+        diagnostics = await diagnostics_module.async_get_config_entry_diagnostics(
+            hass, entry
+        )
+        diagnostics_time = time.perf_counter() - start
+        diagnostics_size = len(json.dumps(diagnostics, default=str))
+
+        # Allocation pass (separate, tracemalloc slows everything down)
+        tracemalloc.start()
+        snapshot_start = tracemalloc.take_snapshot()
+        for _ in range(args.alloc_iterations):
+            await coordinator.async_refresh()
+        _, peak = tracemalloc.get_traced_memory()
+        stats = tracemalloc.take_snapshot().compare_to(snapshot_start, "filename")
+        tracemalloc.stop()
+        allocated = sum(stat.size_diff for stat in stats if stat.size_diff > 0)
+
+        await hass.async_stop(force=True)
+    await runner.cleanup()
+    device_memory = measure_device_memory(api, hub)
+
+    total_entities = sum(entity_counts.values())
+    ms = 1000
+    print("=" * 60)
+    print("Multi-Device Hub Benchmark")
+    print("=" * 60)
+    print(f"Devices:               {args.devices}")
+    print(
+        "Entities:              %d (%s)"
+        % (total_entities, ", ".join(f"{k}={v}" for k, v in entity_counts.items()))
+    )
+    print(f"First refresh:         {first_refresh * ms:.1f} ms")
+    print(f"Entity setup:          {entity_setup * ms:.1f} ms")
+    print()
+    print(f"Refreshes:             {args.iterations} ({failures} failed)")
+    print(f"Refresh latency p50:   {statistics.median(latencies) * ms:.1f} ms")
+    print(f"Refresh latency p95:   {percentile(latencies, 0.95) * ms:.1f} ms")
+    print(f"Refresh latency max:   {max(latencies) * ms:.1f} ms")
+    print(f"State writes/refresh:  {statistics.mean(write_counts):.0f} of {total_entities}")
+    print(
+        "Requests/refresh:      %s"
+        % ", ".join(
+            f"{path}={count / args.iterations:.2f}" for path, count in sorted(requests.items())
+        )
+    )
+    print()
+    print(f"Scene:                 {len(scene_switches)} switches turned off")
+    print(f"Scene latency:         {scene['latency'] * ms:.1f} ms")
+    print(f"Scene requests:        {scene['commands']}")
+    print(f"Scene device polls:    {scene['polls']}")
+    print(f"Scene device fetches:  {scene['device_fetches']}")
+    print()
+    print(f"Churn:                 {args.churn} devices paired, {args.churn} unpaired")
+    print(f"Churn refresh:         {churn['latency'] * ms:.1f} ms")
+    print(f"Churn entities added:  {churn['entities_added']}")
+    print(f"Devices after churn:   {churn['devices']}")
+    print()
+    if push["connected"]:
+        print(f"Push events:           {push['events_sent']} sent over {args.push_duration:.0f} s, {push['events_applied']} applied")
+        print(f"Push state writes:     {push['writes']}")
+        print(f"Polls while pushing:   {push['polls']} (interval {push['scan_interval']:.0f} s)")
+        print(f"Loop lag p95/max:      {push['loop_lag_p95'] * ms:.1f} / {push['loop_lag_max'] * ms:.1f} ms")
+    else:
+        print("Push:                  event stream did not connect")
+    print()
+    print(
+        f"Diagnostics:           {diagnostics_size / 1024:.1f} KiB "
+        f"in {diagnostics_time * ms:.1f} ms"
+    )
+    print()
+    print(f"Allocated/refresh:     {allocated / args.alloc_iterations / 1024:.1f} KiB")
+    print(f"Peak traced memory:    {peak / 1024:.1f} KiB")
+    print(
+        "Device data:           %.1f KiB, %d GC-tracked objects (%.0f B/device)"
+        % (
+            device_memory["bytes"] / 1024,
+            device_memory["objects"],
+            device_memory["bytes"] / max(args.devices, 1),
+        )
+    )
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the multi-device-hub template against a mock hub",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python benchmark_hub.py
+  python benchmark_hub.py --devices 2000 --iterations 50
+  python benchmark_hub.py --latency 20 --failure-rate 0.05
+        """,
+    )
+    parser.add_argument("--devices", type=int, default=500, help="Number of child devices")
+    parser.add_argument("--iterations", type=int, default=20, help="Timed refreshes")
+    parser.add_argument(
+        "--alloc-iterations", type=int, default=5, help="Refreshes traced for allocations"
+    )
+    parser.add_argument("--latency", type=float, default=0.0, help="Mock hub latency in ms")
+    parser.add_argument(
+        "--failure-rate", type=float, default=0.0, help="Fraction of failing hub requests"
+    )
+    parser.add_argument(
+        "--change-rate", type=float, default=0.1,
+        help="Fraction of devices changing per poll",
+    )
+    parser.add_argument("--seed", type=int, default=1, help="Random seed")
+    parser.add_argument(
+        "--scene-size", type=int, default=40, help="Switches turned off in the scene test"
+    )
+    parser.add_argument(
+        "--churn", type=int, default=10, help="Devices paired and unpaired in the churn test"
+    )
+    parser.add_argument(
+        "--event-rate", type=float, default=500, help="Device events/s in the push test"
+    )
+    parser.add_argument(
+        "--push-duration", type=float, default=2.0, help="Seconds the push test runs"
+    )
+    parser.add_argument(
+        "--no-batch", action="store_true", help="Mock hub without the batch switch endpoint"
+    )
+    parser.add_argument(
+        "--template", default=str(TEMPLATE_DIR), help="Path to the multi-device-hub template"
+    )
+
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args))
+
+
+if __name__ == "__main__":
+    main()
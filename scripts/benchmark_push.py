@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Push Integration Benchmark
+==========================
+Floods the push-integration template's PushCoordinator with WebSocket
+messages from a local stand-in device and measures what reaches the
+entities: listener notifications (state writes), coalesced flushes, reader
+queue depth and overflow, and event-loop lag.
+
+Each run compares coalescing windows, so the effect of COALESCE_WINDOW and
+KEY_MAX_RATES can be seen without real hardware. With --replay, a frame
+capture recorded by the template (CAPTURE_FILE) is streamed instead, via
+replay_push_server.py.
+Requires Home Assistant and aiohttp in the current environment.
+
+Usage:
+    python benchmark_push.py                          # 2000 msg/s, windows 0 and 0.1 s
+    python benchmark_push.py --rate 10000 --windows 0 0.05 0.25
+    python benchmark_push.py --power-max-rate 1
+    python benchmark_push.py --windows 0 --listener-cost 500   # overloaded
+    python benchmark_push.py --replay capture.bin --speed 0    # recorded stream
+
+Generated by ha-integration@aurora-smart-home
+https://github.com/tonylofgren/aurora-smart-home
+"""
+
+import argparse
+import asyncio
+import importlib
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, List, Optional
+
+try:
+    import aiohttp
+    from aiohttp import web
+except ImportError:
+    print("aiohttp not installed. Run: pip install aiohttp")
+    sys.exit(1)
+
+from replay_push_server import create_replay_device
+
+try:
+    from homeassistant.const import CONF_HOST
+    from homeassistant.core import HomeAssistant
+except ImportError:
+    print("Home Assistant not installed. Run: pip install homeassistant")
+    sys.exit(1)
+
+TEMPLATE_DIR = (
+    Path(__file__).resolve().parent.parent
+    / "ha-integration-dev" / "templates" / "push-integration"
+)
+PACKAGE = "my_push_integration"
+POWER_KEY = "meter.power"
+
+
+class StandInDevice:
+    """WebSocket device pushing delta messages at a fixed rate."""
+
+    def __init__(self, rate: float, sensors: int, power_share: float, seed: int) -> None:
+        self.rate = rate
+        self.sensors = [f"sensor_{i}" for i in range(sensors)]
+        self.power_share = power_share
+        self.rng = random.Random(seed)
+        self.sent = 0
+        self._clients: List["web.WebSocketResponse"] = []
+
+    def full_state(self) -> Dict[str, Any]:
+        """Return the complete device state."""
+        return {
+            "meter": {"power": 0.0, "energy": 0.0},
+            **{sensor: 0 for sensor in self.sensors},
+        }
+
+    def delta(self) -> Dict[str, Any]:
+        """Return one partial update: mostly power readings, some sensors."""
+        if self.rng.random() < self.power_share:
+            return {"meter": {"power": round(self.rng.uniform(0, 3000), 1)}}
+        return {self.rng.choice(self.sensors): self.rng.randint(0, 100)}
+
+    async def handle_ws(self, request: "web.Request") -> "web.WebSocketResponse":
+        """GET /ws: answer get_state requests, stream deltas while enabled."""
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self._clients.append(ws)
+        async for msg in ws:
+            if json.loads(msg.data).get("type") == "get_state":
+                await ws.send_str(json.dumps(self.full_state()))
+        self._clients.remove(ws)
+        return ws
+
+    async def stream(self, duration: float) -> None:
+        """Push rate messages per second to every client for duration seconds."""
+        loop = asyncio.get_running_loop()
+        start = last = loop.time()
+        due = 0.0
+        while loop.time() - start < duration:
+            await asyncio.sleep(0.005)
+            now = loop.time()
+            due += self.rate * (now - last)
+            last = now
+            while due >= 1:
+                due -= 1
+                frame = json.dumps(self.delta())
+                for ws in self._clients:
+                    await ws.send_str(frame)
+                self.sent += 1
+
+
+class BenchConfigEntry:
+    """Minimal config entry carrying what the template reads from it."""
+
+    def __init__(self, host: str) -> None:
+        self.entry_id = "benchmark"
+        self.data = {CONF_HOST: host}
+        self.options: Dict[str, Any] = {}
+
+
+def load_template(path: Path) -> ModuleType:
+    """Import the template's coordinator without running its __init__.py."""
+    package = ModuleType(PACKAGE)
+    package.__path__ = [str(path)]
+    sys.modules[PACKAGE] = package
+    return importlib.import_module(f"{PACKAGE}.coordinator")
+
+
+async def measure_loop_lag(stop: asyncio.Event, lags: List[float]) -> None:
+    """Record how late 10 ms sleeps wake up while the event loop is busy."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.01)
+        lags.append(time.perf_counter() - start - 0.01)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Return the pct percentile of values."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def replay_keys(coordinator_module: ModuleType, device) -> List[str]:
+    """Return the top-level keys of a recording's first frame."""
+    _, frame_type, payload = device.frames[0]
+    if frame_type == device.text_type:
+        msg = aiohttp.WSMessage(aiohttp.WSMsgType.TEXT, payload.decode(), None)
+    else:
+        msg = aiohttp.WSMessage(aiohttp.WSMsgType.BINARY, payload, None)
+    decoder = coordinator_module.FrameDecoder(coordinator_module.BINARY_FORMAT)
+    return list(decoder.decode(msg) or {})
+
+
+async def run_once(
+    coordinator_module: ModuleType,
+    args,
+    window: float,
+    power_max_rate: Optional[float],
+) -> Dict[str, Any]:
+    """Stream to a fresh coordinator with one coalescing setup."""
+    # Key listeners (MyPushEntity) are only notified in delta-merging mode
+    coordinator_module.MERGE_DELTAS = True
+    coordinator_module.COALESCE_WINDOW = window
+    coordinator_module.KEY_MAX_RATES = (
+        {POWER_KEY: power_max_rate} if power_max_rate else {}
+    )
+
+    if args.replay:
+        device = create_replay_device(
+            Path(args.replay), args.speed, Path(args.template)
+        )
+    else:
+        device = StandInDevice(args.rate, args.sensors, args.power_share, args.seed)
+    app = web.Application()
+    app.router.add_get("/ws", device.handle_ws)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    host = "%s:%s" % runner.addresses[0][:2]
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        coordinator = coordinator_module.PushCoordinator(hass, BenchConfigEntry(host))
+
+        # One "entity" per key, like MyPushEntity, counting its state writes
+        writes: Dict[str, int] = {}
+
+        def add_listeners(keys: List[str]) -> None:
+            for key in keys:
+                def write_state(_key=key):
+                    writes[_key] = writes.get(_key, 0) + 1
+                    # Simulate the cost of a real state write on a busy instance
+                    end = time.perf_counter() + args.listener_cost / 1e6
+                    while time.perf_counter() < end:
+                        pass
+
+                coordinator.async_add_key_listener(key, write_state)
+
+        lags: List[float] = []
+        stop = asyncio.Event()
+        if args.replay:
+            # The recording starts as soon as the state is requested, so
+            # everything is measured from connect, keyed by the first frame
+            add_listeners(replay_keys(coordinator_module, device))
+            lag_task = asyncio.ensure_future(measure_loop_lag(stop, lags))
+            messages_before = 0
+            await coordinator.async_setup()
+            await device.done.wait()
+        else:
+            await coordinator.async_setup()
+            while coordinator.data is None:
+                await asyncio.sleep(0.01)
+            add_listeners([POWER_KEY, *device.sensors])
+            lag_task = asyncio.ensure_future(measure_loop_lag(stop, lags))
+            messages_before = coordinator.messages
+            await device.stream(args.duration)
+        await asyncio.sleep(max(window, 1 / power_max_rate if power_max_rate else 0) + 0.2)
+        stop.set()
+        await lag_task
+
+        result = {
+            "window": window,
+            "sent": device.sent,
+            "received": coordinator.messages - messages_before,
+            "flushes": coordinator.flushes,
+            "writes": sum(writes.values()),
+            "power_writes": writes.get(POWER_KEY, 0),
+            "max_queue": coordinator.max_queue_depth,
+            "overflow": coordinator.queue_merged + coordinator.queue_dropped,
+            "lag_p50": statistics.median(lags),
+            "lag_p95": percentile(lags, 0.95),
+            "lag_max": max(lags),
+        }
+        await coordinator.async_shutdown()
+        await hass.async_stop(force=True)
+    await runner.cleanup()
+    return result
+
+
+async def run_benchmark(args) -> None:
+    """Run the benchmark and print a report."""
+    coordinator_module = load_template(Path(args.template))
+    results = [
+        await run_once(coordinator_module, args, window, args.power_max_rate)
+        for window in args.windows
+    ]
+
+    ms = 1000
+    print("=" * 72)
+    print("Push Integration Benchmark")
+    print("=" * 72)
+    if args.replay:
+        speed = f"{args.speed:g}x" if args.speed else "max speed"
+        print(f"Replay:           {args.replay} at {speed}")
+    else:
+        print(f"Rate:             {args.rate:.0f} msg/s for {args.duration:.0f} s "
+              f"({args.power_share:.0%} {POWER_KEY}, {args.sensors} other keys)")
+    if args.power_max_rate:
+        print(f"Power max rate:   {args.power_max_rate} updates/s")
+    if args.listener_cost:
+        print(f"Listener cost:    {args.listener_cost:.0f} us per notification")
+    print()
+    print(f"{'window':>8} {'sent':>7} {'recv':>7} {'flushes':>7} {'writes':>7} "
+          f"{'power':>6} {'qmax':>5} {'overflw':>7} {'lag p50':>8} {'lag p95':>8} "
+          f"{'lag max':>8}")
+    for r in results:
+        print(
+            f"{r['window'] * ms:>6.0f}ms {r['sent']:>7} {r['received']:>7} "
+            f"{r['flushes']:>7} {r['writes']:>7} {r['power_writes']:>6} "
+            f"{r['max_queue']:>5} {r['overflow']:>7} "
+            f"{r['lag_p50'] * ms:>6.1f}ms {r['lag_p95'] * ms:>6.1f}ms "
+            f"{r['lag_max'] * ms:>6.1f}ms"
+        )
+    print("=" * 72)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the push-integration template's update coalescing",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python benchmark_push.py
+  python benchmark_push.py --rate 10000 --windows 0 0.05 0.25
+  python benchmark_push.py --power-max-rate 1
+  python benchmark_push.py --windows 0 --listener-cost 500
+  python benchmark_push.py --replay capture.bin --speed 10
+        """,
+    )
+    parser.add_argument("--rate", type=float, default=2000, help="Messages per second")
+    parser.add_argument("--duration", type=float, default=3.0, help="Seconds to stream")
+    parser.add_argument(
+        "--windows", type=float, nargs="+", default=[0.0, 0.1],
+        help="Coalescing windows in seconds to compare",
+    )
+    parser.add_argument(
+        "--power-max-rate", type=float,
+        help=f"Max updates/s for {POWER_KEY} (KEY_MAX_RATES)",
+    )
+    parser.add_argument("--sensors", type=int, default=20, help="Other keys in the state")
+    parser.add_argument(
+        "--power-share", type=float, default=0.8,
+        help=f"Fraction of messages updating {POWER_KEY}",
+    )
+    parser.add_argument(
+        "--listener-cost", type=float, default=0.0,
+        help="Busy-wait per notification in microseconds (simulates a loaded instance)",
+    )
+    parser.add_argument("--seed", type=int, default=1, help="Random seed")
+    parser.add_argument(
+        "--replay", help="Stream a frame capture instead of generated messages"
+    )
+    parser.add_argument(
+        "--speed", type=float, default=0.0,
+        help="Replay speed factor (1 = recorded pace, 0 = max speed)",
+    )
+    parser.add_argument(
+        "--template", default=str(TEMPLATE_DIR), help="Path to the push-integration template"
+    )
+
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args))
+
+
+if __name__ == "__main__":
+    main()
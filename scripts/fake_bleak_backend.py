@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+Fake Bleak Backend
+==================
+Offline stand-in for bleak.BleakClient and a simulated BLE peripheral, with
+configurable connect latency, connect failures, read latency, notifications
+and connection drops.
+
+Run as a script, it polls the simulated device the way the
+bluetooth-integration template used to (a new connection per poll, reads
+one by one, no retries) and through the template's GattConnection
+(persistent connection, retries with backoff, notifications), and compares
+connects, reads and time spent.
+
+FakeBleakClient can also be passed as client_class to GattConnection in
+your own experiments. Requires bleak.
+
+Usage:
+    python fake_bleak_backend.py                           # 20 polls
+    python fake_bleak_backend.py --failure-rate 0.5 --drop-at 10
+    python fake_bleak_backend.py --notify-rate 0           # polling only
+
+Generated by ha-integration@aurora-smart-home
+https://github.com/tonylofgren/aurora-smart-home
+"""
+
+import argparse
+import asyncio
+import importlib
+import random
+import struct
+import sys
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    from bleak import BleakError
+except ImportError:
+    print("bleak not installed. Run: pip install bleak")
+    sys.exit(1)
+
+TEMPLATE_DIR = (
+    Path(__file__).resolve().parent.parent
+    / "ha-integration-dev" / "templates" / "bluetooth-integration"
+)
+PACKAGE = "my_bluetooth_device"
+
+
+class FakeCharacteristic:
+    """GATT characteristic with its properties."""
+
+    def __init__(self, uuid: str, properties: List[str]) -> None:
+        self.uuid = uuid
+        self.properties = properties
+
+
+class FakeServices:
+    """Minimal BleakGATTServiceCollection."""
+
+    def __init__(self, characteristics: Dict[str, FakeCharacteristic]) -> None:
+        self._characteristics = characteristics
+
+    def get_characteristic(self, uuid: str) -> Optional[FakeCharacteristic]:
+        """Return the characteristic with this UUID, if the device has it."""
+        return self._characteristics.get(uuid)
+
+
+class FakeGattDevice:
+    """Simulated peripheral: battery level and a notifying temperature."""
+
+    def __init__(
+        self,
+        battery_uuid: str,
+        temperature_uuid: str,
+        connect_latency: float,
+        read_latency: float,
+        failure_rate: float,
+        notify: bool,
+        seed: int,
+    ) -> None:
+        self.address = "AA:BB:CC:DD:EE:FF"
+        self.battery_uuid = battery_uuid
+        self.temperature_uuid = temperature_uuid
+        self.connect_latency = connect_latency
+        self.read_latency = read_latency
+        self.failure_rate = failure_rate
+        self.rng = random.Random(seed)
+        self.battery = 87
+        self.temperature = 2150  # 0.01 °C
+        self.characteristics = {
+            battery_uuid: FakeCharacteristic(battery_uuid, ["read"]),
+            temperature_uuid: FakeCharacteristic(
+                temperature_uuid, ["read", "notify"] if notify else ["read"]
+            ),
+        }
+        self.clients: List["FakeBleakClient"] = []
+        self.connect_attempts = 0
+        self.connect_time = 0.0
+        self.reads = 0
+        self.notifications = 0
+
+    def value(self, uuid: str) -> bytearray:
+        """Return the current raw value of a characteristic."""
+        if uuid == self.battery_uuid:
+            return bytearray([self.battery])
+        return bytearray(struct.pack("<h", self.temperature))
+
+    def change_temperature(self) -> None:
+        """Random-walk the temperature and notify subscribed clients."""
+        self.temperature += self.rng.choice((-10, 10))
+        for client in list(self.clients):
+            client.notify(self.temperature_uuid, self.value(self.temperature_uuid))
+
+    def drop_connections(self) -> None:
+        """Disconnect every client from the device side (out of range)."""
+        for client in list(self.clients):
+            client.lost()
+
+    async def run_notifications(self, rate: float) -> None:
+        """Change the temperature rate times per second."""
+        while True:
+            await asyncio.sleep(1 / rate)
+            self.change_temperature()
+
+
+class FakeBleakClient:
+    """Stand-in for bleak.BleakClient connected to a FakeGattDevice."""
+
+    def __init__(
+        self,
+        device: FakeGattDevice,
+        disconnected_callback: Optional[Callable[["FakeBleakClient"], None]] = None,
+        timeout: float = 10.0,
+        **kwargs: Any,
+    ) -> None:
+        self._device = device
+        self._disconnected_callback = disconnected_callback
+        self._timeout = timeout
+        self._connected = False
+        self._subscriptions: Dict[str, Callable[[Any, bytearray], None]] = {}
+        self.services = FakeServices(device.characteristics)
+
+    @property
+    def address(self) -> str:
+        """Return the device address."""
+        return self._device.address
+
+    @property
+    def is_connected(self) -> bool:
+        """Return True while connected."""
+        return self._connected
+
+    async def connect(self, **kwargs: Any) -> None:
+        """Connect, taking connect_latency and failing at failure_rate."""
+        device = self._device
+        device.connect_attempts += 1
+        start = time.perf_counter()
+        await asyncio.sleep(min(device.connect_latency, self._timeout))
+        device.connect_time += time.perf_counter() - start
+        if device.rng.random() < device.failure_rate:
+            raise BleakError("Fake device did not respond")
+        self._connected = True
+        device.clients.append(self)
+
+    async def disconnect(self) -> None:
+        """Disconnect from the device."""
+        if self._connected:
+            self._connected = False
+            self._subscriptions.clear()
+            self._device.clients.remove(self)
+
+    async def read_gatt_char(self, uuid: str, **kwargs: Any) -> bytearray:
+        """Read a characteristic value."""
+        if not self._connected:
+            raise BleakError("Not connected")
+        if uuid not in self._device.characteristics:
+            raise BleakError(f"Characteristic {uuid} not found")
+        await asyncio.sleep(self._device.read_latency)
+        self._device.reads += 1
+        return self._device.value(uuid)
+
+    async def start_notify(
+        self, uuid: str, callback: Callable[[Any, bytearray], None], **kwargs: Any
+    ) -> None:
+        """Subscribe to notifications of a characteristic."""
+        characteristic = self._device.characteristics.get(uuid)
+        if characteristic is None or "notify" not in characteristic.properties:
+            raise BleakError(f"Characteristic {uuid} does not notify")
+        self._subscriptions[uuid] = callback
+
+    async def stop_notify(self, uuid: str) -> None:
+        """Unsubscribe from a characteristic."""
+        self._subscriptions.pop(uuid, None)
+
+    def notify(self, uuid: str, value: bytearray) -> None:
+        """Deliver a notification from the device."""
+        if callback := self._subscriptions.get(uuid):
+            self._device.notifications += 1
+            callback(self._device.characteristics[uuid], value)
+
+    def lost(self) -> None:
+        """Handle the device dropping the connection."""
+        self._connected = False
+        self._subscriptions.clear()
+        self._device.clients.remove(self)
+        if self._disconnected_callback:
+            self._disconnected_callback(self)
+
+    async def __aenter__(self) -> "FakeBleakClient":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.disconnect()
+
+
+def load_template(path: Path) -> Dict[str, ModuleType]:
+    """Import the template's connection and parser modules (no Home Assistant)."""
+    package = ModuleType(PACKAGE)
+    package.__path__ = [str(path)]
+    sys.modules[PACKAGE] = package
+    return {
+        name: importlib.import_module(f"{PACKAGE}.{name}")
+        for name in ("const", "connection", "parser")
+    }
+
+
+def create_device(modules: Dict[str, ModuleType], args) -> FakeGattDevice:
+    """Create a simulated device from the command line options."""
+    const = modules["const"]
+    return FakeGattDevice(
+        const.CHAR_BATTERY_LEVEL,
+        const.CHAR_TEMPERATURE,
+        args.connect_latency,
+        args.read_latency,
+        args.failure_rate,
+        args.notify_rate > 0,
+        args.seed,
+    )
+
+
+async def poll_per_connection(modules: Dict[str, ModuleType], args) -> Dict[str, Any]:
+    """Poll like the template used to: connect, read one by one, disconnect."""
+    device = create_device(modules, args)
+    uuids = list(modules["parser"].CHARACTERISTIC_PARSERS)
+    failed = 0
+    start = time.perf_counter()
+    for poll in range(args.polls):
+        if poll == args.drop_at:
+            device.drop_connections()
+        try:
+            async with FakeBleakClient(device) as client:
+                for uuid in uuids:
+                    await client.read_gatt_char(uuid)
+        except BleakError:
+            failed += 1
+        await asyncio.sleep(args.interval)
+    return report("connect per poll", device, failed, time.perf_counter() - start)
+
+
+async def poll_persistent(modules: Dict[str, ModuleType], args) -> Dict[str, Any]:
+    """Poll through the template's GattConnection."""
+    connection_module = modules["connection"]
+    connection_module.CONNECT_BACKOFF = args.backoff
+    parsers = modules["parser"].CHARACTERISTIC_PARSERS
+    device = create_device(modules, args)
+    gatt = connection_module.GattConnection(
+        lambda: device,
+        lambda uuid, value: None,  # the coordinator updates entities here
+        idle_timeout=args.idle_timeout,
+        client_class=FakeBleakClient,
+    )
+    notifier = None
+    if args.notify_rate > 0:
+        notifier = asyncio.ensure_future(device.run_notifications(args.notify_rate))
+
+    failed = 0
+    start = time.perf_counter()
+    for poll in range(args.polls):
+        if poll == args.drop_at:
+            device.drop_connections()
+        try:
+            values = await gatt.async_read(parsers)
+        except BleakError:
+            failed += 1
+        else:
+            # Values served from notifications must match the device
+            temperature = parsers[device.temperature_uuid].parse(
+                values[device.temperature_uuid]
+            )["temperature"]
+            assert round(temperature * 100) == device.temperature
+        await asyncio.sleep(args.interval)
+    elapsed = time.perf_counter() - start
+
+    if notifier is not None:
+        notifier.cancel()
+    await gatt.async_disconnect()
+    return report("GattConnection", device, failed, elapsed)
+
+
+def report(
+    mode: str, device: FakeGattDevice, failed: int, elapsed: float
+) -> Dict[str, Any]:
+    """Collect the device-side counters of one run."""
+    return {
+        "mode": mode,
+        "failed": failed,
+        "attempts": device.connect_attempts,
+        "connect_time": device.connect_time,
+        "reads": device.reads,
+        "notifications": device.notifications,
+        "elapsed": elapsed,
+    }
+
+
+async def run(args) -> None:
+    """Run both polling modes and print a report."""
+    modules = load_template(Path(args.template))
+    results = [
+        await poll_per_connection(modules, args),
+        await poll_persistent(modules, args),
+    ]
+
+    print("=" * 72)
+    print("GATT Connection Comparison (fake Bleak backend)")
+    print("=" * 72)
+    print(f"Polls:            {args.polls} every {args.interval * 1000:.0f} ms")
+    print(f"Connect:          {args.connect_latency * 1000:.0f} ms, "
+          f"{args.failure_rate:.0%} failures")
+    print(f"Notifications:    "
+          f"{f'{args.notify_rate:g}/s' if args.notify_rate else 'off'}")
+    if args.drop_at is not None:
+        print(f"Connection drop:  before poll {args.drop_at}")
+    print()
+    print(f"{'mode':<18} {'failed':>6} {'attempts':>8} {'connecting':>10} "
+          f"{'reads':>6} {'notifs':>6} {'total':>8}")
+    for r in results:
+        print(
+            f"{r['mode']:<18} {r['failed']:>6} {r['attempts']:>8} "
+            f"{r['connect_time']:>9.2f}s {r['reads']:>6} {r['notifications']:>6} "
+            f"{r['elapsed']:>7.2f}s"
+        )
+    print("=" * 72)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare BLE polling strategies against a fake Bleak backend",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python fake_bleak_backend.py
+  python fake_bleak_backend.py --failure-rate 0.5 --drop-at 10
+  python fake_bleak_backend.py --notify-rate 0 --idle-timeout 0.05
+        """,
+    )
+    parser.add_argument("--polls", type=int, default=20, help="Number of polls")
+    parser.add_argument(
+        "--interval", type=float, default=0.1, help="Seconds between polls"
+    )
+    parser.add_argument(
+        "--connect-latency", type=float, default=0.3, help="Seconds per connect"
+    )
+    parser.add_argument(
+        "--read-latency", type=float, default=0.02, help="Seconds per read"
+    )
+    parser.add_argument(
+        "--failure-rate", type=float, default=0.2, help="Fraction of connects failing"
+    )
+    parser.add_argument(
+        "--notify-rate", type=float, default=5.0,
+        help="Temperature notifications per second (0 = device can't notify)",
+    )
+    parser.add_argument(
+        "--idle-timeout", type=float, default=1.0,
+        help="GattConnection idle timeout in seconds",
+    )
+    parser.add_argument(
+        "--backoff", type=float, default=0.05,
+        help="First connect retry delay in seconds (CONNECT_BACKOFF)",
+    )
+    parser.add_argument(
+        "--drop-at", type=int, help="Drop the connection before this poll"
+    )
+    parser.add_argument("--seed", type=int, default=1, help="Random seed")
+    parser.add_argument(
+        "--template", default=str(TEMPLATE_DIR),
+        help="Path to the bluetooth-integration template",
+    )
+
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ Generates secure secrets for ESPHome configurations.
 Usage:
     python generate_secrets.py              # Print to console
     python generate_secrets.py --output     # Create secrets.yaml file
+    python generate_secrets.py --scan DIR   # Generate secrets missing for DIR
     python generate_secrets.py --help       # Show help
 
 Generated by esphome@aurora-smart-home
@@ -16,8 +17,19 @@ https://github.com/tonylofgren/aurora-smart-home
 import secrets
 import base64
 import argparse
+import re
 import sys
 from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+
+# Raw-text patterns: a regex sweep is enough to find `!secret` references
+# and existing secrets.yaml keys, no YAML parsing (or PyYAML) needed.
+SECRET_REF_PATTERN = re.compile(rb"!secret\s+([A-Za-z0-9_.-]+)")
+# YAML comments start a line or follow whitespace; stripped before the sweep
+# so commented-out references aren't generated
+COMMENT_PATTERN = re.compile(rb"(?:^|(?<=\s))#.*", re.MULTILINE)
+SECRET_KEY_PATTERN = re.compile(r"^([A-Za-z0-9_.-]+)\s*:", re.MULTILINE)
 
 
 def generate_api_key() -> str:
@@ -35,6 +47,101 @@ def generate_wifi_ap_password() -> str:
     return secrets.token_hex(4)
 
 
+# Passwords of networks and brokers that already exist; other passwords
+# (OTA, fallback AP, web server) are set by the device and can be generated
+USER_PASSWORD_PREFIXES = ("wifi_", "mqtt_")
+
+
+def is_user_secret(key: str) -> bool:
+    """Check if a secret must be supplied by the user (SSID, usernames, hosts...)."""
+    name = key.lower()
+    if name.endswith("encryption_key") or name == "api_key":
+        return False
+    if name.endswith("ap_password"):
+        return False
+    return name.startswith(USER_PASSWORD_PREFIXES) or not name.endswith("password")
+
+
+def generate_secret_value(key: str) -> str:
+    """Generate a value in the format expected for a secret key name."""
+    name = key.lower()
+    if is_user_secret(key):
+        return f"YOUR_{key.upper()}"
+    if name.endswith("encryption_key") or name == "api_key":
+        return generate_api_key()
+    if name.endswith("ap_password") or name == "fallback_password":
+        return generate_wifi_ap_password()
+    return generate_password(12)
+
+
+def find_secret_references(directory: Path) -> Dict[str, List[Path]]:
+    """Find every `!secret` reference in the YAML files under a directory."""
+    references: Dict[str, List[Path]] = {}
+    paths = sorted([*directory.rglob("*.yaml"), *directory.rglob("*.yml")])
+    for path in paths:
+        if "secret" in path.name.lower():
+            continue
+        content = COMMENT_PATTERN.sub(b"", path.read_bytes())
+        for match in SECRET_REF_PATTERN.finditer(content):
+            references.setdefault(match.group(1).decode("utf-8"), []).append(path)
+    return references
+
+
+def read_existing_secrets(secrets_path: Path) -> Set[str]:
+    """Return the keys already defined in a secrets.yaml file."""
+    if not secrets_path.exists():
+        return set()
+    return set(SECRET_KEY_PATTERN.findall(secrets_path.read_text(encoding="utf-8")))
+
+
+def create_missing_secrets_yaml(keys: Iterable[str]) -> str:
+    """Generate secrets.yaml lines for the given keys."""
+    lines = [
+        "",
+        "# Added by generate_secrets.py --scan",
+    ]
+    for key in sorted(keys):
+        lines.append(f'{key}: "{generate_secret_value(key)}"')
+    return "\n".join(lines) + "\n"
+
+
+def scan_and_generate(directory: Path, output: Optional[str] = None) -> None:
+    """Generate exactly the secrets referenced under a directory but not yet defined.
+
+    Prints them if output is None, otherwise appends them to output, or to
+    DIR/secrets.yaml if output is "".
+    """
+    if not directory.is_dir():
+        print(f"Error: {directory} is not a directory")
+        sys.exit(1)
+
+    secrets_path = Path(output) if output else directory / "secrets.yaml"
+    references = find_secret_references(directory)
+    missing = sorted(set(references) - read_existing_secrets(secrets_path))
+
+    print(f"Found {len(references)} secret(s) referenced under {directory}")
+    if not missing:
+        print(f"✓ {secrets_path} already defines every referenced secret")
+        return
+
+    for key in missing:
+        files = ", ".join(sorted({p.name for p in references[key]}))
+        print(f"  missing: {key} (used in {files})")
+
+    content = create_missing_secrets_yaml(missing)
+    if output is None:
+        print()
+        print(content.lstrip("\n"), end="")
+        return
+
+    with secrets_path.open("a", encoding="utf-8") as f:
+        f.write(content)
+    print(f"✓ Added {len(missing)} secret(s) to {secrets_path}")
+    placeholders = [key for key in missing if is_user_secret(key)]
+    if placeholders:
+        print(f"  Edit placeholders in {secrets_path}: {', '.join(placeholders)}")
+
+
 def create_secrets_yaml(
     wifi_ssid: str = "YOUR_WIFI_SSID",
     wifi_password: str = "YOUR_WIFI_PASSWORD"
@@ -102,15 +209,18 @@ Examples:
   python generate_secrets.py --output           # Create secrets.yaml
   python generate_secrets.py -o my_secrets.yaml # Custom filename
   python generate_secrets.py --wifi-ssid "MyNetwork" --wifi-password "MyPass"
+  python generate_secrets.py --scan ./esphome/  # Show secrets missing for configs
+  python generate_secrets.py --scan ./esphome/ -o # Append them to ./esphome/secrets.yaml
         """
     )
 
     parser.add_argument(
         '-o', '--output',
         nargs='?',
-        const='secrets.yaml',
+        # "" for a bare -o: secrets.yaml, in DIR with --scan
+        const='',
         metavar='FILE',
-        help='Output to file (default: secrets.yaml)'
+        help='Output to file (default: secrets.yaml, in DIR with --scan)'
     )
 
     parser.add_argument(
@@ -131,14 +241,24 @@ Examples:
         help='Only output an API encryption key'
     )
 
+    parser.add_argument(
+        '--scan',
+        metavar='DIR',
+        help='Scan DIR for !secret references and generate only the missing ones'
+    )
+
     args = parser.parse_args()
 
     if args.api_key_only:
         print(generate_api_key())
         return
 
-    if args.output:
-        output_path = Path(args.output)
+    if args.scan:
+        scan_and_generate(Path(args.scan), args.output)
+        return
+
+    if args.output is not None:
+        output_path = Path(args.output or 'secrets.yaml')
 
         if output_path.exists():
             response = input(f"{output_path} already exists. Overwrite? [y/N] ")
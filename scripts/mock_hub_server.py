@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Mock Hub Server
+===============
+Local stand-in for the hub API used by the multi-device-hub integration
+template (ha-integration-dev/templates/multi-device-hub).
+
+Serves /api/hub, /api/devices[/{id}], the (batch) switch endpoints and the
+/api/events WebSocket event stream with a configurable number of child devices,
+response latency, failure rate and event rate, so the template can be
+exercised and benchmarked without real hardware.
+
+Usage:
+    python mock_hub_server.py                          # 50 devices on :8080
+    python mock_hub_server.py --devices 1000 --latency 50
+    python mock_hub_server.py --failure-rate 0.1 --change-rate 0.2
+    python mock_hub_server.py --event-rate 100      # push 100 device events/s
+
+Generated by ha-integration@aurora-smart-home
+https://github.com/tonylofgren/aurora-smart-home
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+from typing import Any, Dict, List, Optional, Set
+
+try:
+    from aiohttp import web
+except ImportError:
+    print("aiohttp not installed. Run: pip install aiohttp")
+    sys.exit(1)
+
+
+DEFAULT_API_KEY = "test-api-key"
+
+# Device models: sensors and switches each model reports
+DEVICE_MODELS = {
+    "TH-100": {"sensors": ("temperature", "humidity", "battery"), "switches": ()},
+    "MS-200": {"sensors": ("motion", "battery"), "switches": ()},
+    "DS-300": {"sensors": ("door", "battery"), "switches": ()},
+    "PL-400": {"sensors": ("temperature",), "switches": ("power",)},
+    "NL-500": {"sensors": ("motion",), "switches": ("power", "night_light")},
+}
+
+
+def _sensor_value(rng: random.Random, sensor: str) -> Any:
+    """Generate a plausible value for a sensor key."""
+    if sensor == "temperature":
+        return round(rng.uniform(18.0, 26.0), 1)
+    if sensor == "humidity":
+        return round(rng.uniform(30.0, 60.0), 1)
+    if sensor == "battery":
+        return rng.randint(20, 100)
+    return rng.random() < 0.1  # motion / door
+
+
+class MockHub:
+    """In-memory hub state and request behaviour."""
+
+    def __init__(
+        self,
+        device_count: int = 50,
+        latency: float = 0.0,
+        failure_rate: float = 0.0,
+        change_rate: float = 0.1,
+        api_key: str = DEFAULT_API_KEY,
+        seed: Optional[int] = None,
+        batch: bool = True,
+        push: bool = True,
+        event_rate: float = 0.0,
+    ) -> None:
+        self.latency = latency
+        self.batch = batch
+        self.push = push
+        self.event_rate = event_rate  # device events per second on /api/events
+        self.events_sent = 0
+        self._subscribers: Set["web.WebSocketResponse"] = set()
+        self.failure_rate = failure_rate
+        self.change_rate = change_rate
+        self.api_key = api_key
+        self.rng = random.Random(seed)
+        self.requests: Dict[str, int] = {}
+        self.version = 0  # Bumped on every state change, used as the ETag
+        self.hub_info = {
+            "id": "mock-hub-0001",
+            "name": "Mock Hub",
+            "model": "MockHub 1",
+            "firmware": "1.0.0",
+        }
+        self.devices: Dict[str, Dict[str, Any]] = {}
+        self._next_index = 0
+        self.add_devices(device_count)
+
+    def add_devices(self, count: int) -> List[str]:
+        """Pair new child devices with the hub."""
+        models = list(DEVICE_MODELS)
+        added = []
+        for _ in range(count):
+            index = self._next_index
+            self._next_index += 1
+            model = models[index % len(models)]
+            spec = DEVICE_MODELS[model]
+            device_id = f"dev{index:05d}"
+            self.devices[device_id] = {
+                "id": device_id,
+                "name": f"{model} {index}",
+                "model": model,
+                "firmware": "2.1.0",
+                "online": True,
+                "sensors": {s: _sensor_value(self.rng, s) for s in spec["sensors"]},
+                "switches": {s: False for s in spec["switches"]},
+            }
+            added.append(device_id)
+            self.broadcast({"type": "device_added", "id": device_id})
+        if added:
+            self.version += 1
+        return added
+
+    def remove_devices(self, count: int) -> List[str]:
+        """Unpair the oldest child devices from the hub."""
+        removed = list(self.devices)[:count]
+        for device_id in removed:
+            del self.devices[device_id]
+            self.broadcast({"type": "device_removed", "id": device_id})
+        if removed:
+            self.version += 1
+        return removed
+
+    def mutate(self) -> List[str]:
+        """Change sensor values and availability on a fraction of devices."""
+        changed = []
+        for device_id, device in self.devices.items():
+            if self.rng.random() >= self.change_rate:
+                continue
+            for sensor in device["sensors"]:
+                device["sensors"][sensor] = _sensor_value(self.rng, sensor)
+            device["online"] = self.rng.random() > 0.02
+            changed.append(device_id)
+        if changed:
+            self.version += 1
+        return changed
+
+    def mutate_one(self) -> Dict[str, Any]:
+        """Change one random sensor value; returns the device event for it."""
+        device_id = self.rng.choice(list(self.devices))
+        device = self.devices[device_id]
+        event: Dict[str, Any] = {"type": "device", "id": device_id}
+        if device["sensors"]:
+            sensor = self.rng.choice(list(device["sensors"]))
+            device["sensors"][sensor] = _sensor_value(self.rng, sensor)
+            event["sensors"] = {sensor: device["sensors"][sensor]}
+        self.version += 1
+        return event
+
+    def broadcast(self, event: Dict[str, Any]) -> None:
+        """Send an event to every /api/events subscriber."""
+        for ws in list(self._subscribers):
+            if ws.closed:
+                self._subscribers.discard(ws)
+                continue
+            asyncio.ensure_future(ws.send_json(event))
+        self.events_sent += bool(self._subscribers)
+
+    async def emit_events(self, app: "web.Application"):
+        """Background task emitting device events at event_rate (cleanup ctx)."""
+
+        async def emit() -> None:
+            loop = asyncio.get_running_loop()
+            last = loop.time()
+            due = 0.0
+            while True:
+                await asyncio.sleep(0.01)
+                now = loop.time()
+                elapsed, last = now - last, now
+                if not self._subscribers or not self.event_rate:
+                    due = 0.0
+                    continue
+                due += self.event_rate * elapsed
+                while due >= 1:
+                    due -= 1
+                    self.broadcast(self.mutate_one())
+
+        task = asyncio.ensure_future(emit())
+        yield
+        task.cancel()
+        for ws in list(self._subscribers):
+            await ws.close()
+
+    @property
+    def etag(self) -> str:
+        """ETag for the current device state."""
+        return f'"{self.version}"'
+
+    async def simulate(self, request: "web.Request") -> None:
+        """Apply auth, latency and random failures to a request."""
+        self.requests[request.path] = self.requests.get(request.path, 0) + 1
+        if request.headers.get("Authorization") != f"Bearer {self.api_key}":
+            raise web.HTTPUnauthorized()
+        if self.latency:
+            await asyncio.sleep(self.latency * self.rng.uniform(0.5, 1.5))
+        if self.failure_rate and self.rng.random() < self.failure_rate:
+            raise web.HTTPServiceUnavailable()
+
+    async def handle_hub(self, request: "web.Request") -> "web.Response":
+        """GET /api/hub."""
+        await self.simulate(request)
+        return web.json_response(self.hub_info)
+
+    async def handle_devices(self, request: "web.Request") -> "web.Response":
+        """GET /api/devices (honours If-None-Match)."""
+        await self.simulate(request)
+        self.mutate()
+        if request.headers.get("If-None-Match") == self.etag:
+            return web.Response(status=304, headers={"ETag": self.etag})
+        return web.json_response(
+            {"devices": list(self.devices.values())}, headers={"ETag": self.etag}
+        )
+
+    async def handle_device(self, request: "web.Request") -> "web.Response":
+        """GET /api/devices/{device_id}."""
+        await self.simulate(request)
+        device = self.devices.get(request.match_info["device_id"])
+        if device is None:
+            raise web.HTTPNotFound()
+        return web.json_response(device)
+
+    async def handle_switch(self, request: "web.Request") -> "web.Response":
+        """POST /api/devices/{device_id}/switches/{switch_id}."""
+        await self.simulate(request)
+        device = self.devices.get(request.match_info["device_id"])
+        switch_id = request.match_info["switch_id"]
+        if device is None or switch_id not in device["switches"]:
+            raise web.HTTPNotFound()
+        body = await request.json()
+        device["switches"][switch_id] = bool(body.get("state"))
+        self.version += 1
+        self.broadcast(
+            {"type": "device", "id": device["id"], "switches": device["switches"]}
+        )
+        return web.json_response({"state": device["switches"][switch_id]})
+
+    async def handle_switch_batch(self, request: "web.Request") -> "web.Response":
+        """POST /api/switches with {"commands": [{device_id, switch_id, state}]}."""
+        await self.simulate(request)
+        body = await request.json()
+        for command in body.get("commands", []):
+            device = self.devices.get(command["device_id"])
+            if device is None or command["switch_id"] not in device["switches"]:
+                raise web.HTTPNotFound()
+            device["switches"][command["switch_id"]] = bool(command["state"])
+            self.broadcast(
+                {"type": "device", "id": device["id"], "switches": device["switches"]}
+            )
+        self.version += 1
+        return web.json_response({"applied": len(body.get("commands", []))})
+
+    async def handle_events(self, request: "web.Request") -> "web.WebSocketResponse":
+        """GET /api/events (WebSocket stream of device events)."""
+        await self.simulate(request)
+        ws = web.WebSocketResponse(heartbeat=30)
+        await ws.prepare(request)
+        self._subscribers.add(ws)
+        try:
+            async for _ in ws:
+                pass  # Clients don't send anything
+        finally:
+            self._subscribers.discard(ws)
+        return ws
+
+    def create_app(self) -> "web.Application":
+        """Create the aiohttp application serving the hub API."""
+        app = web.Application()
+        app.router.add_get("/api/hub", self.handle_hub)
+        app.router.add_get("/api/devices", self.handle_devices)
+        app.router.add_get("/api/devices/{device_id}", self.handle_device)
+        app.router.add_post(
+            "/api/devices/{device_id}/switches/{switch_id}", self.handle_switch
+        )
+        if self.batch:
+            app.router.add_post("/api/switches", self.handle_switch_batch)
+        if self.push:
+            app.router.add_get("/api/events", self.handle_events)
+            app.cleanup_ctx.append(self.emit_events)
+        return app
+
+
+async def start_server(
+    hub: MockHub, host: str = "127.0.0.1", port: int = 0
+) -> "web.AppRunner":
+    """Start the mock hub; returns the runner (address in runner.addresses)."""
+    runner = web.AppRunner(hub.create_app(), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    return runner
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run a local stand-in for the multi-device-hub API",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python mock_hub_server.py
+  python mock_hub_server.py --devices 1000 --latency 50
+  python mock_hub_server.py --failure-rate 0.1 --port 8123
+  python mock_hub_server.py --event-rate 100
+        """,
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address")
+    parser.add_argument("--port", type=int, default=8080, help="Port (default: 8080)")
+    parser.add_argument("--devices", type=int, default=50, help="Number of child devices")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Mean response latency in ms"
+    )
+    parser.add_argument(
+        "--failure-rate", type=float, default=0.0, help="Fraction of requests failing with 503"
+    )
+    parser.add_argument(
+        "--change-rate", type=float, default=0.1,
+        help="Fraction of devices whose values change per device poll",
+    )
+    parser.add_argument("--api-key", default=DEFAULT_API_KEY, help="Expected API key")
+    parser.add_argument("--seed", type=int, help="Random seed for reproducible runs")
+    parser.add_argument(
+        "--no-batch", action="store_true",
+        help="Disable POST /api/switches (clients fall back to per-switch requests)",
+    )
+
+    parser.add_argument(
+        "--event-rate", type=float, default=0.0,
+        help="Device events per second pushed on /api/events",
+    )
+    parser.add_argument(
+        "--no-push", action="store_true",
+        help="Disable the /api/events stream (clients poll only)",
+    )
+
+    args = parser.parse_args()
+
+    hub = MockHub(
+        device_count=args.devices,
+        latency=args.latency / 1000,
+        failure_rate=args.failure_rate,
+        change_rate=args.change_rate,
+        api_key=args.api_key,
+        seed=args.seed,
+        batch=not args.no_batch,
+        push=not args.no_push,
+        event_rate=args.event_rate,
+    )
+    print(f"Mock hub with {args.devices} devices on http://{args.host}:{args.port}")
+    print(f"API key: {args.api_key}")
+    web.run_app(hub.create_app(), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
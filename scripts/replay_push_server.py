@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Push Replay Server
+==================
+Serves a frame capture recorded by the push-integration template
+(CAPTURE_FILE in const.py) on a local WebSocket, so a production stream can
+be replayed against the coordinator deterministically.
+
+When a client sends {"type": "get_state"} (as PushCoordinator does after
+connecting), the recording is replayed from its first frame at the original
+pace, sped up, or as fast as possible.
+
+Usage:
+    python replay_push_server.py capture.bin                 # 1x on :8765/ws
+    python replay_push_server.py capture.bin --speed 10
+    python replay_push_server.py capture.bin --speed 0       # max speed
+
+Generated by ha-integration@aurora-smart-home
+https://github.com/tonylofgren/aurora-smart-home
+"""
+
+import argparse
+import asyncio
+import importlib
+import json
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import List, Tuple
+
+try:
+    from aiohttp import web
+except ImportError:
+    print("aiohttp not installed. Run: pip install aiohttp")
+    sys.exit(1)
+
+TEMPLATE_DIR = (
+    Path(__file__).resolve().parent.parent
+    / "ha-integration-dev" / "templates" / "push-integration"
+)
+PACKAGE = "my_push_integration"
+
+
+def load_capture_module(path: Path) -> ModuleType:
+    """Import the template's capture module (no Home Assistant needed)."""
+    package = sys.modules.get(PACKAGE)
+    if package is None:
+        package = ModuleType(PACKAGE)
+        package.__path__ = [str(path)]
+        sys.modules[PACKAGE] = package
+    return importlib.import_module(f"{PACKAGE}.capture")
+
+
+class ReplayDevice:
+    """WebSocket endpoint replaying recorded frames."""
+
+    def __init__(self, frames: List[Tuple[float, int, bytes]], text_type: int,
+                 speed: float) -> None:
+        self.frames = frames
+        self.text_type = text_type
+        self.speed = speed  # 1 = recorded pace, 0 = as fast as possible
+        self.sent = 0
+        self.done = asyncio.Event()
+
+    async def handle_ws(self, request: "web.Request") -> "web.WebSocketResponse":
+        """GET /ws: replay the recording whenever the full state is requested."""
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        replay = None
+        async for msg in ws:
+            if json.loads(msg.data).get("type") == "get_state":
+                if replay is not None:
+                    replay.cancel()
+                replay = asyncio.ensure_future(self.replay(ws))
+        if replay is not None:
+            replay.cancel()
+        return ws
+
+    async def replay(self, ws: "web.WebSocketResponse") -> None:
+        """Send every frame, keeping the recorded spacing divided by speed."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for count, (timestamp, frame_type, payload) in enumerate(self.frames, 1):
+            if self.speed:
+                delay = start + timestamp / self.speed - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            elif count % 100 == 0:
+                await asyncio.sleep(0)  # let the client side run
+            if frame_type == self.text_type:
+                await ws.send_str(payload.decode())
+            else:
+                await ws.send_bytes(payload)
+            self.sent += 1
+        self.done.set()
+
+
+def create_replay_device(path: Path, speed: float, template: Path) -> ReplayDevice:
+    """Load a capture file into a ReplayDevice."""
+    capture = load_capture_module(template)
+    frames = list(capture.read_capture(path))
+    return ReplayDevice(frames, capture.FRAME_TEXT, speed)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Replay a recorded push stream on a local WebSocket",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python replay_push_server.py capture.bin
+  python replay_push_server.py capture.bin --speed 10
+  python replay_push_server.py capture.bin --speed 0 --port 9000
+        """,
+    )
+    parser.add_argument("capture", help="Capture file recorded by the template")
+    parser.add_argument(
+        "--speed", type=float, default=1.0,
+        help="Replay speed factor (1 = recorded pace, 0 = max speed)",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address")
+    parser.add_argument("--port", type=int, default=8765, help="Port (default: 8765)")
+    parser.add_argument(
+        "--template", default=str(TEMPLATE_DIR), help="Path to the push-integration template"
+    )
+
+    args = parser.parse_args()
+
+    device = create_replay_device(Path(args.capture), args.speed, Path(args.template))
+    if not device.frames:
+        print(f"No frames in {args.capture}")
+        sys.exit(1)
+    duration = device.frames[-1][0]
+    pace = f"{args.speed:g}x ({duration / args.speed:.1f} s)" if args.speed else "max speed"
+    print(f"Replaying {len(device.frames)} frames recorded over {duration:.1f} s at {pace}")
+    print(f"Point the integration at host {args.host}:{args.port} (ws://.../ws)")
+
+    app = web.Application()
+    app.router.add_get("/ws", device.handle_ws)
+    web.run_app(app, host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()